@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict
+import io
 import os
 import platform
 import sys
@@ -10,11 +11,11 @@ from prefect.context import get_run_context
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 import pandas as pd
-from prefect_dask import DaskTaskRunner
+from prefect.task_runners import ConcurrentTaskRunner
 
 from src.data.sources.alpaca_source import AlpacaDataSource
 from src.data.symbol_manager import SymbolManager
-from src.database.db_manager import DatabaseManager
+from src.database.db_manager import get_db_manager
 from src.database.models import MarketData
 
 
@@ -27,7 +28,10 @@ def generate_flow_run_name(flow_prefix: str) -> str:
     Returns:
         str: Flow run name in format: prefix-YYYYMMDD-HHMMSS-{context}
     """
-    timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+    # Direct integer formatting skips strftime's locale-aware C path
+    n = datetime.now()
+    timestamp = (f"{n.year:04d}{n.month:02d}{n.day:02d}"
+                 f"-{n.hour:02d}{n.minute:02d}{n.second:02d}")
 
     # Get environment info for debugging
     env = os.getenv('ENVIRONMENT', 'dev')
@@ -43,13 +47,18 @@ def generate_flow_run_name(flow_prefix: str) -> str:
 
 
 @task(retries=3, retry_delay_seconds=60)
-def collect_market_data() -> dict:
-    """Task to collect market data for all active symbols."""
+def collect_market_data(symbols: Optional[List[str]] = None) -> dict:
+    """Task to collect market data for the given symbols.
+
+    Args:
+        symbols: Symbols to collect. Defaults to all active symbols; pass
+            the list from the flow to avoid a duplicate database query.
+    """
     logger.info("Starting data collection")
 
     try:
-        # Get active symbols
-        symbols = SymbolManager.get_active_symbols()
+        if symbols is None:
+            symbols = SymbolManager.get_active_symbols()
         logger.debug(f"Retrieved active symbols: {symbols}")  # Debug log
         if not symbols:
             logger.warning("No active symbols found")
@@ -66,15 +75,19 @@ def collect_market_data() -> dict:
             lookback_days=1  # Get last 24 hours of data
         )
 
-        # Detailed logging for collected data
+        # Detailed logging for collected data. Lazy formatting defers the
+        # payload construction (head/info/index dumps) until DEBUG is enabled.
+        debug = logger.opt(lazy=True).debug
         for symbol, df in data.items():
-            logger.debug(f"Data for {symbol}: {len(df)} rows")
-            logger.debug(f"DataFrame columns: {df.columns.tolist()}")
+            debug("Data for {}: {} rows", lambda: symbol, lambda: len(df))
+            debug("DataFrame columns: {}", lambda: df.columns.tolist())
             if not df.empty:
-                logger.debug(f"Sample data for {symbol}:\n{df.head(1)}")
-                logger.debug(f"DataFrame info:\n{df.info()}")
-                logger.debug(f"DataFrame index type: {type(df.index)}")
-                logger.debug(f"DataFrame index values: {df.index.tolist()}")
+                debug("Sample data for {}:\n{}", lambda: symbol, lambda: df.head(1))
+                # df.info() prints to stderr and returns None, so it never
+                # belonged in a log message; shape/dtypes carry the same facts
+                debug("DataFrame shape {} dtypes={}", lambda: df.shape, lambda: df.dtypes.to_dict())
+                debug("DataFrame index type: {}", lambda: type(df.index))
+                debug("DataFrame index values: {}", lambda: df.index.tolist())
             else:
                 logger.warning(f"Empty DataFrame received for {symbol}")
 
@@ -86,6 +99,57 @@ def collect_market_data() -> dict:
         raise
 
 
+# Batches below this size go through executemany; COPY only pays off once
+# the per-row INSERT parse/plan overhead dominates
+COPY_THRESHOLD = 500
+
+# Compiled once at import; upsert prevents duplicate (symbol, timestamp) rows
+_UPSERT_STMT = text("""
+    INSERT INTO market_data (symbol, timestamp, open, high, low, close, volume)
+    VALUES (:symbol, :timestamp, :open, :high, :low, :close, :volume)
+    ON CONFLICT (symbol, timestamp)
+    DO UPDATE SET
+        open = EXCLUDED.open,
+        high = EXCLUDED.high,
+        low = EXCLUDED.low,
+        close = EXCLUDED.close,
+        volume = EXCLUDED.volume
+""")
+
+
+def _copy_upsert_market_data(session: Session, rows: pd.DataFrame) -> None:
+    """Bulk-load rows into market_data via COPY through a temp staging table.
+
+    COPY streams the batch in one protocol message, bypassing per-row
+    parse/plan; the staged rows are then merged with a single upsert.
+    """
+    buf = io.StringIO()
+    rows.to_csv(buf, index=False, header=False)
+    buf.seek(0)
+
+    cursor = session.connection().connection.cursor()
+    cursor.execute("""
+        CREATE TEMP TABLE _market_data_stage
+        (LIKE market_data INCLUDING DEFAULTS) ON COMMIT DROP
+    """)
+    cursor.copy_expert(
+        "COPY _market_data_stage (symbol, timestamp, open, high, low, close, volume) FROM STDIN CSV",
+        buf
+    )
+    cursor.execute("""
+        INSERT INTO market_data (symbol, timestamp, open, high, low, close, volume)
+        SELECT symbol, timestamp, open, high, low, close, volume
+        FROM _market_data_stage
+        ON CONFLICT (symbol, timestamp)
+        DO UPDATE SET
+            open = EXCLUDED.open,
+            high = EXCLUDED.high,
+            low = EXCLUDED.low,
+            close = EXCLUDED.close,
+            volume = EXCLUDED.volume
+    """)
+
+
 @task
 def store_market_data(data: dict):
     """Task to store collected market data in the database."""
@@ -93,66 +157,81 @@ def store_market_data(data: dict):
         logger.warning("No data to store")
         return
 
-    db = DatabaseManager()
-    with db.get_session() as session:
-        for symbol, df in data.items():
-            if df.empty:
-                logger.warning(f"No data to store for symbol {symbol}")
-                continue
-
-            # Reset index to make timestamp a column
-            df = df.reset_index()
-
-            for _, row in df.iterrows():
-                try:
-                    # Use upsert operation to prevent duplicates
-                    stmt = text("""
-                        INSERT INTO market_data (symbol, timestamp, open, high, low, close, volume)
-                        VALUES (:symbol, :timestamp, :open, :high, :low, :close, :volume)
-                        ON CONFLICT (symbol, timestamp) 
-                        DO UPDATE SET
-                            open = EXCLUDED.open,
-                            high = EXCLUDED.high,
-                            low = EXCLUDED.low,
-                            close = EXCLUDED.close,
-                            volume = EXCLUDED.volume
-                    """)
-
-                    # Convert timestamp to UTC if it has timezone info
-                    timestamp = row['timestamp']
-                    if hasattr(timestamp, 'tz_localize'):
-                        timestamp = timestamp.tz_localize(None)
-
-                    params = {
-                        'symbol': symbol,
-                        'timestamp': timestamp,
-                        'open': float(row['open']),
-                        'high': float(row['high']),
-                        'low': float(row['low']),
-                        'close': float(row['close']),
-                        'volume': int(row['volume'])
-                    }
-
-                    session.execute(stmt, params)
-
-                except Exception as e:
-                    logger.error(f"Error storing data for {symbol}: {str(e)}")
-                    logger.error(f"Row data: {row.to_dict()}")
-                    continue
+    # Combine all symbols into one frame so the whole batch goes through a
+    # single vectorized dtype pass and a single insert
+    frames = []
+    for symbol, df in data.items():
+        if df.empty:
+            logger.warning(f"No data to store for symbol {symbol}")
+            continue
+        frames.append(df.reset_index().assign(symbol=symbol))
 
-        try:
-            session.commit()
-            logger.info("Data storage completed successfully")
-        except Exception as e:
-            logger.error(f"Error committing data to database: {str(e)}")
-            session.rollback()
-            raise
+    if not frames:
+        logger.warning("No data to store")
+        return
+
+    combined = pd.concat(frames, ignore_index=True)
+
+    # Convert timestamps to naive UTC in one vectorized pass
+    combined['timestamp'] = pd.to_datetime(combined['timestamp'], utc=True).dt.tz_localize(None)
+
+    # Cast each column once in C instead of coercing every cell with
+    # float()/int() inside the row loop
+    combined = combined.astype({
+        'open': 'float64',
+        'high': 'float64',
+        'low': 'float64',
+        'close': 'float64',
+        'volume': 'int64'
+    }, copy=False)
+
+    rows = combined[['symbol', 'timestamp', 'open', 'high', 'low', 'close', 'volume']]
+
+    db = get_db_manager()
+    try:
+        # One round trip and one commit for the whole batch; large batches
+        # stream through COPY instead of executemany
+        with db.get_session() as session:
+            if len(rows) >= COPY_THRESHOLD:
+                _copy_upsert_market_data(session, rows)
+            else:
+                # Columns are already cast, and to_dict boxes cells as
+                # native Python scalars, so no per-row conversion remains
+                session.execute(_UPSERT_STMT, rows.to_dict('records'))
+        logger.info("Data storage completed successfully")
+    except Exception as e:
+        logger.error(f"Error committing data to database: {str(e)}")
+        raise
+
+
+@task(retries=3, retry_delay_seconds=60)
+def fetch_symbol_data(symbol: str, interval: str = "1h",
+                      lookback_days: int = 1) -> pd.DataFrame:
+    """Task to fetch the latest bars for a single symbol.
+
+    One task per symbol lets a concurrent runner overlap the network
+    fetches and gives Prefect per-symbol retries instead of re-running
+    the whole batch when one symbol fails.
+    """
+    alpaca_source = AlpacaDataSource()
+    return alpaca_source.get_latest_data(
+        symbol, interval=interval, lookback_days=lookback_days)
+
+
+@task
+def store_symbol_data(symbol: str, df: Optional[pd.DataFrame]) -> None:
+    """Task to store one symbol's collected bars."""
+    if df is None or df.empty:
+        logger.warning(f"No data to store for symbol {symbol}")
+        return
+    store_market_data.fn({symbol: df})
 
 
 @flow(name="Market Data Collection", flow_run_name=generate_flow_run_name("market-data"))
 def market_data_collection_flow():
     """Flow for collecting and storing market data."""
-    data = collect_market_data()
+    symbols = SymbolManager.get_active_symbols()
+    data = collect_market_data(symbols)
     store_market_data(data)
 
 
@@ -219,7 +298,7 @@ def cleanup_old_data(days_to_keep: int = 3):
     logger.info(f"Cleaning up data older than {days_to_keep} days...")
 
     try:
-        db = DatabaseManager()
+        db = get_db_manager()
         with db.get_session() as session:
             # Delete old market data
             cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
@@ -280,11 +359,18 @@ def send_maintenance_report(inactive_symbols: List[str], deleted_data_count: int
 
 @flow(name="End-of-Day Maintenance",
       flow_run_name=generate_flow_run_name("eod-maintenance"),
-      task_runner=DaskTaskRunner(cluster_kwargs={"n_workers": 3, "processes": False}))
+      # Tasks here are I/O-bound (API calls, SQL); a thread-based runner
+      # parallelizes them without Dask's scheduler overhead. A threaded
+      # Dask LocalCluster gave no real parallelism under the GIL anyway.
+      task_runner=ConcurrentTaskRunner())
 def end_of_day_maintenance_flow():
     """Flow for end-of-day maintenance tasks."""
     logger.info("Starting end-of-day maintenance flow...")
 
+    # Warm the engine/pool once before tasks fan out across threads, so
+    # they share an initialized manager instead of racing on first init
+    get_db_manager()
+
     # Check symbol status
     inactive_symbols = check_symbol_status()
 
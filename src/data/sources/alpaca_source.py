@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List
 
@@ -139,59 +140,76 @@ class AlpacaDataSource(DataSource):
         logger.debug(f"Date range: {start_date} to {end_date}")
         logger.debug(f"Lookback period: {lookback_days} days")
         
-        # Split symbols into smaller batches to avoid rate limits
+        # The API multiplexes up to 100 symbols per request, so the only
+        # remaining fan-out is across batches; requests release the GIL on
+        # I/O, so a small thread pool overlaps them without extra machinery
         batch_size = 100
+        batches = [symbols[i:i + batch_size] for i in range(0, len(symbols), batch_size)]
+        if not batches:
+            # ThreadPoolExecutor rejects max_workers=0
+            return {}
+        timeframe = self._convert_interval(interval)
+
         result = {}
-        
-        for i in range(0, len(symbols), batch_size):
-            batch_symbols = symbols[i:i + batch_size]
-            logger.debug(f"Processing batch {i//batch_size + 1} of {(len(symbols) + batch_size - 1)//batch_size}")
-            
-            try:
-                request_params = StockBarsRequest(
-                    symbol_or_symbols=batch_symbols,
-                    timeframe=self._convert_interval(interval),
-                    start=start_date,
-                    end=end_date,
-                    feed="iex"  # Use IEX feed instead of SIP
-                )
-                
-                logger.debug("Making API request to Alpaca...")
-                logger.debug(f"Request parameters: {request_params}")
-                bars = self.client.get_stock_bars(request_params)
-                logger.debug(f"Received response from Alpaca for {len(batch_symbols)} symbols")
-                
-                # Convert the response to a dictionary of DataFrames
-                for symbol in batch_symbols:
-                    if symbol in bars:
-                        df = pd.DataFrame(bars[symbol])
-                        logger.debug(f"Got data for {symbol}: {len(df)} rows")
-                        logger.debug(f"Data range for {symbol}: {df.index.min()} to {df.index.max()}")
-                        
-                        # Add symbol column and reset index
-                        df.insert(0, "symbol", symbol)
-                        df.reset_index(inplace=True)
-                        
-                        # Add missing columns if not present
-                        if 'trade_count' not in df.columns:
-                            df['trade_count'] = 0
-                        if 'vwap' not in df.columns:
-                            df['vwap'] = 0
-                            
-                        result[symbol] = self._standardize_columns(df)
-                    else:
-                        logger.warning(f"No data available for symbol {symbol}")
-                
-                # Add a small delay between batches to avoid rate limits
-                if i + batch_size < len(symbols):
-                    time.sleep(1)
-                    
-            except Exception as e:
-                logger.error(f"Error fetching data for batch: {str(e)}")
-                logger.error(f"Request parameters: {request_params}")
-                # Continue with next batch even if this one fails
-                continue
-        
+        with ThreadPoolExecutor(max_workers=min(4, len(batches))) as executor:
+            batch_results = executor.map(
+                lambda batch: self._fetch_symbol_batch(batch, timeframe, start_date, end_date),
+                batches
+            )
+            for batch_result in batch_results:
+                result.update(batch_result)
+
+        return result
+
+    def _fetch_symbol_batch(
+        self,
+        batch_symbols: List[str],
+        timeframe: TimeFrame,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict[str, pd.DataFrame]:
+        """Fetch and standardize one batch of symbols in a single request."""
+        result = {}
+        try:
+            request_params = StockBarsRequest(
+                symbol_or_symbols=batch_symbols,
+                timeframe=timeframe,
+                start=start_date,
+                end=end_date,
+                feed="iex"  # Use IEX feed instead of SIP
+            )
+
+            logger.debug("Making API request to Alpaca...")
+            logger.debug(f"Request parameters: {request_params}")
+            bars = self.client.get_stock_bars(request_params)
+            logger.debug(f"Received response from Alpaca for {len(batch_symbols)} symbols")
+
+            # Convert the response to a dictionary of DataFrames
+            for symbol in batch_symbols:
+                if symbol in bars:
+                    df = pd.DataFrame(bars[symbol])
+                    logger.debug(f"Got data for {symbol}: {len(df)} rows")
+                    logger.debug(f"Data range for {symbol}: {df.index.min()} to {df.index.max()}")
+
+                    # Add symbol column and reset index
+                    df.insert(0, "symbol", symbol)
+                    df.reset_index(inplace=True)
+
+                    # Add missing columns if not present
+                    if 'trade_count' not in df.columns:
+                        df['trade_count'] = 0
+                    if 'vwap' not in df.columns:
+                        df['vwap'] = 0
+
+                    result[symbol] = self._standardize_columns(df)
+                else:
+                    logger.warning(f"No data available for symbol {symbol}")
+
+        except Exception as e:
+            logger.error(f"Error fetching data for batch: {str(e)}")
+            logger.error(f"Batch symbols: {batch_symbols}")
+            # Return whatever was collected; other batches proceed regardless
+
         return result
 
     def get_extended_historical_data(
@@ -317,27 +335,24 @@ class AlpacaDataSource(DataSource):
             't': 'timestamp'
         }
         
-        # Create a new DataFrame with standardized column names
-        standardized_df = df.copy()
-        
-        # Rename columns if they exist
-        for old_col, new_col in column_map.items():
-            if old_col in standardized_df.columns:
-                standardized_df[new_col] = standardized_df[old_col]
-                logger.debug(f"Renamed column {old_col} to {new_col}")
-        
-        # Ensure all required columns exist
-        required_columns = ['open', 'high', 'low', 'close', 'volume', 'trade_count', 'vwap']
-        for col in required_columns:
-            if col not in standardized_df.columns:
-                standardized_df[col] = 0
-                logger.debug(f"Added missing column: {col}")
-        
+        # Raw payloads sometimes arrive with a column of bar dicts per
+        # symbol; expand them with one from_records pass instead of
+        # pulling fields out row by row in Python
+        bar_columns = [
+            col for col in df.columns
+            if isinstance(df[col].iloc[0], dict)
+        ]
+        if bar_columns:
+            df = pd.DataFrame.from_records(df[bar_columns[0]].tolist())
+
+        # rename relabels in one pass without copying column data
+        standardized_df = df.rename(columns=column_map)
+
         # Set timestamp as index if it exists
         if 'timestamp' in standardized_df.columns:
             try:
                 # Convert timestamp to datetime
-                standardized_df['timestamp'] = pd.to_datetime(standardized_df['timestamp'])
+                standardized_df['timestamp'] = pd.to_datetime(standardized_df['timestamp'], utc=True)
                 # Set as index
                 standardized_df.set_index('timestamp', inplace=True)
                 logger.debug("Successfully set timestamp as index")
@@ -345,10 +360,12 @@ class AlpacaDataSource(DataSource):
                 logger.error(f"Failed to convert timestamp: {e}")
                 logger.debug(f"Timestamp column data: {standardized_df['timestamp'].head()}")
                 return pd.DataFrame()
-        
-        # Keep only the required columns
-        standardized_df = standardized_df[required_columns]
-        
+
+        # Project to the required columns, zero-filling any that are
+        # missing, in a single reindex instead of a per-column loop
+        required_columns = ['open', 'high', 'low', 'close', 'volume', 'trade_count', 'vwap']
+        standardized_df = standardized_df.reindex(columns=required_columns, fill_value=0)
+
         logger.debug(f"Final DataFrame shape: {standardized_df.shape}")
         logger.debug(f"Final DataFrame columns: {standardized_df.columns.tolist()}")
         return standardized_df 
\ No newline at end of file
@@ -4,18 +4,25 @@ Yahoo Finance data loader for company information.
 import yfinance as yf
 import pandas as pd
 import time
+import functools
 from loguru import logger
 from sqlalchemy import text
 import random
 from typing import Dict, Any, Optional, List
 
-from src.database.db_manager import DatabaseManager
+from src.database.db_manager import get_db_manager
 from src.data.symbol_manager import SymbolManager
 
 
+@functools.lru_cache(maxsize=None)
+def _quote_field(field: str) -> str:
+    """Quote fields that start with digits or contain uppercase letters."""
+    return f'"{field}"' if field[:1].isdigit() or not field.islower() else field
+
+
 class YahooFinanceDataLoader:
     def __init__(self):
-        self.db = DatabaseManager()
+        self.db = get_db_manager()
         self.rate_limit_delay = 2  # Base delay between requests in seconds
         self.max_retries = 3  # Maximum number of retries for failed requests
         self.raw_data = []  # List to store raw ticker info
@@ -81,46 +88,40 @@ class YahooFinanceDataLoader:
         if not officers:
             return
 
-        session = None
         try:
-            session = self.db.get_session().__enter__()
-            
-            # First, delete existing officers for this symbol
-            delete_stmt = text("DELETE FROM yahoo_company_officers WHERE symbol = :symbol")
-            session.execute(delete_stmt, {'symbol': symbol})
-            
-            # Insert new officers
-            for officer in officers:
+            # get_session() is a context manager that commits on success,
+            # rolls back on error and always closes the session
+            with self.db.get_session() as session:
+                # First, delete existing officers for this symbol
+                delete_stmt = text("DELETE FROM yahoo_company_officers WHERE symbol = :symbol")
+                session.execute(delete_stmt, {'symbol': symbol})
+
+                # Insert new officers
                 insert_stmt = text("""
-                    INSERT INTO yahoo_company_officers 
+                    INSERT INTO yahoo_company_officers
                     (symbol, name, title, age, year_born, fiscal_year, total_pay, exercised_value, unexercised_value)
-                    VALUES 
+                    VALUES
                     (:symbol, :name, :title, :age, :year_born, :fiscal_year, :total_pay, :exercised_value, :unexercised_value)
                 """)
-                
-                session.execute(insert_stmt, {
-                    'symbol': symbol,
-                    'name': officer.get('name'),
-                    'title': officer.get('title'),
-                    'age': officer.get('age'),
-                    'year_born': officer.get('yearBorn'),
-                    'fiscal_year': officer.get('fiscalYear'),
-                    'total_pay': officer.get('totalPay'),
-                    'exercised_value': officer.get('exercisedValue'),
-                    'unexercised_value': officer.get('unexercisedValue')
-                })
-            
-            session.commit()
+
+                for officer in officers:
+                    session.execute(insert_stmt, {
+                        'symbol': symbol,
+                        'name': officer.get('name'),
+                        'title': officer.get('title'),
+                        'age': officer.get('age'),
+                        'year_born': officer.get('yearBorn'),
+                        'fiscal_year': officer.get('fiscalYear'),
+                        'total_pay': officer.get('totalPay'),
+                        'exercised_value': officer.get('exercisedValue'),
+                        'unexercised_value': officer.get('unexercisedValue')
+                    })
+
             logger.info(f"Stored {len(officers)} company officers for {symbol}")
-            
+
         except Exception as e:
-            if session:
-                session.rollback()
             logger.error(f"Error storing company officers for {symbol}: {e}")
             raise
-        finally:
-            if session:
-                session.close()
 
     def load_ticker_info_chunk(self, stock_symbols):
         # List to store processed data for the current chunk
@@ -134,63 +135,56 @@ class YahooFinanceDataLoader:
 
         return ticker_info_list
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _build_upsert_statement(fields):
+        """Build the yahoo_company_info upsert statement for a set of fields.
+
+        Cached per unique field tuple so the quoting scan and string
+        assembly run once per statement signature, not once per chunk.
+        """
+        quoted_fields = [_quote_field(field) for field in fields]
+        placeholders = [f":{field}" for field in fields]
+
+        insert_stmt = f"""
+            INSERT INTO yahoo_company_info ({', '.join(quoted_fields)})
+            VALUES ({', '.join(placeholders)})
+            ON CONFLICT (symbol) DO UPDATE SET
+        """
+
+        update_parts = []
+        for field in fields:
+            if field != 'symbol':  # Skip symbol in UPDATE part
+                quoted_field = _quote_field(field)
+                update_parts.append(f"{quoted_field} = COALESCE(EXCLUDED.{quoted_field}, yahoo_company_info.{quoted_field})")
+
+        insert_stmt += ', '.join(update_parts)
+        insert_stmt += ", updated_at = CURRENT_TIMESTAMP"
+        return text(insert_stmt)
+
     def store_company_info(self, company_info_list):
         """Store company information in the database."""
         if not company_info_list:
             return
 
-        session = None
+        # Group rows by their field set so each group can go through a single
+        # executemany call instead of one round trip per row
+        grouped_rows = {}
+        for info in company_info_list:
+            grouped_rows.setdefault(tuple(info.keys()), []).append(info)
+
         try:
-            session = self.db.get_session().__enter__()
-            
-            for info in company_info_list:
-                try:
-                    # Create dynamic SQL statement based on available fields
-                    fields = list(info.keys())
-                    # Quote fields that start with numbers or contain uppercase letters
-                    quoted_fields = []
-                    for field in fields:
-                        if field[0].isdigit() or any(c.isupper() for c in field):
-                            quoted_fields.append(f'"{field}"')
-                        else:
-                            quoted_fields.append(field)
-                    placeholders = [f":{field}" for field in fields]
-                    
-                    # Create the INSERT statement
-                    insert_stmt = f"""
-                        INSERT INTO yahoo_company_info ({', '.join(quoted_fields)})
-                        VALUES ({', '.join(placeholders)})
-                        ON CONFLICT (symbol) DO UPDATE SET
-                    """
-                    
-                    # Create the UPDATE part of the statement
-                    update_parts = []
-                    for field in fields:
-                        if field != 'symbol':  # Skip symbol in UPDATE part
-                            quoted_field = f'"{field}"' if field[0].isdigit() or any(c.isupper() for c in field) else field
-                            update_parts.append(f"{quoted_field} = COALESCE(EXCLUDED.{quoted_field}, yahoo_company_info.{quoted_field})")
-                    
-                    insert_stmt += ', '.join(update_parts)
-                    insert_stmt += ", updated_at = CURRENT_TIMESTAMP"
-                    
-                    # Execute the statement
-                    session.execute(text(insert_stmt), info)
-                    logger.info(f"Stored company info for {info['symbol']}")
-                    
-                except Exception as e:
-                    logger.error(f"Error storing company info for {info['symbol']}: {e}")
-                    raise
-
-            session.commit()
+            # One transaction for the whole chunk via SQLAlchemy Core,
+            # bypassing ORM change tracking entirely
+            with self.db.engine.begin() as conn:
+                for fields, rows in grouped_rows.items():
+                    stmt = self._build_upsert_statement(fields)
+                    conn.execute(stmt, rows)
+                    logger.info(f"Stored company info for {len(rows)} symbols")
             logger.info("Successfully committed company information to database")
         except Exception as e:
-            if session:
-                session.rollback()
             logger.error(f"Error in database transaction: {e}")
             raise
-        finally:
-            if session:
-                session.close()
 
     def load_ticker_info(self, stock_symbols):
         # Process stocks in smaller chunks to avoid rate limits
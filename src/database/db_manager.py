@@ -2,12 +2,18 @@
 Database manager module for handling PostgreSQL connections and operations.
 """
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Generator, Optional, Dict, Any
 import os
 from pathlib import Path
 import yaml
+try:
+    # C-accelerated loader parses much faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
 from sqlalchemy.pool import QueuePool
 from loguru import logger
 from dotenv import load_dotenv
@@ -16,20 +22,45 @@ from prefect.blocks.system import Secret
 from src.database.models import Base
 
 
+# Load .env once per process; repeat constructions skip the file I/O
+_DOTENV_LOADED = False
+
+
+def _load_dotenv_once(env_path: Path) -> None:
+    """Load environment variables from .env on first call only."""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv(env_path)
+        _DOTENV_LOADED = True
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a YAML file, cached on (path, mtime) so edits invalidate it."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
 class DatabaseManager:
     """Manages database connections and operations."""
 
     _instance = None
 
-    def __new__(cls):
+    def __new__(cls, *args, **kwargs):
         """Singleton pattern to ensure only one database connection."""
         if cls._instance is None:
             cls._instance = super(DatabaseManager, cls).__new__(cls)
             cls._instance._initialized = False
         return cls._instance
 
-    def __init__(self):
-        """Initialize the database manager if not already initialized."""
+    def __init__(self, db_config: Optional[Dict[str, Any]] = None):
+        """Initialize the database manager if not already initialized.
+
+        Args:
+            db_config: Optional overrides for the database section. Keys
+                supplied here (e.g. user/password/host/name) are used
+                directly, skipping the Prefect Secret round-trip for each.
+        """
         if self._initialized:
             return
 
@@ -39,24 +70,32 @@ class DatabaseManager:
 
         # Load environment variables from .env file
         env_path = Path(__file__).parent.parent.parent / "config" / ".env"
-        load_dotenv(env_path)
+        _load_dotenv_once(env_path)
 
-        self._load_config()
+        self._load_config(db_config)
         self._initialize_connection()
+        self._pid = os.getpid()
         self._initialized = True
 
-    def _load_config(self) -> None:
-        """Load database configuration from YAML file and Prefect secrets."""
+    def _load_config(self, overrides: Optional[Dict[str, Any]] = None) -> None:
+        """Load database configuration from YAML file and Prefect secrets.
+
+        Credentials already present in ``overrides`` are taken as-is, so
+        callers that hold them can hand them over directly instead of
+        paying a Secret.load round-trip per value.
+        """
         try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
-                self.db_config = config['database']
+            config = _load_yaml_cached(self.config_path, os.path.getmtime(self.config_path))
+            # Copy before merging secrets so the cached dict stays pristine
+            self.db_config = dict(config['database'])
+            if overrides:
+                self.db_config.update(overrides)
 
-            # Load credentials from Prefect secrets
-            self.db_config['user'] = Secret.load("db-user").get()
-            self.db_config['password'] = Secret.load("db-password").get()
-            self.db_config['host'] = Secret.load("db-host").get()
-            self.db_config['name'] = Secret.load("db-name").get()
+            # Load only the credentials the caller didn't supply
+            for key, block in (('user', 'db-user'), ('password', 'db-password'),
+                               ('host', 'db-host'), ('name', 'db-name')):
+                if not overrides or key not in overrides:
+                    self.db_config[key] = Secret.load(block).get()
 
         except Exception as e:
             logger.error(f"Failed to load database configuration: {e}")
@@ -70,20 +109,39 @@ class DatabaseManager:
                 f"{self.db_config['host']}:{self.db_config['port']}/{self.db_config['name']}"
             )
 
+            # Scale the pool with the configured worker count so concurrent
+            # loaders don't queue on checkout
+            worker_count = self.db_config.get('worker_count', 4)
+            pool_size = self.db_config.get('pool_size') or max(10, 2 * worker_count)
+
             self.engine = create_engine(
                 connection_string,
                 poolclass=QueuePool,
-                pool_size=self.db_config.get('pool_size', 5),
+                pool_size=pool_size,
                 max_overflow=self.db_config.get('max_overflow', 10),
-                pool_timeout=30,
-                pool_recycle=1800
+                pool_timeout=self.db_config.get('pool_timeout', 30),
+                pool_recycle=self.db_config.get('pool_recycle', 1800),
+                pool_pre_ping=self.db_config.get('pool_pre_ping', True),
+                pool_use_lifo=self.db_config.get('pool_use_lifo', True),
+                connect_args={
+                    # TCP keepalives surface dead peers quickly instead of
+                    # hanging a checked-out connection
+                    'keepalives': 1,
+                    'keepalives_idle': 30,
+                    'keepalives_interval': 10,
+                    'keepalives_count': 5,
+                    'options': f"-c statement_timeout={self.db_config.get('statement_timeout_ms', 30000)}"
+                }
             )
 
-            self.SessionLocal = sessionmaker(
+            # scoped_session hands repeated calls on the same thread the
+            # same Session, so back-to-back reads in one render share the
+            # identity map instead of checking out fresh connections
+            self.SessionLocal = scoped_session(sessionmaker(
                 autocommit=False,
                 autoflush=False,
                 bind=self.engine
-            )
+            ))
 
             logger.info("Database connection initialized successfully")
 
@@ -113,6 +171,15 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def remove_session(self) -> None:
+        """Dispose of the current thread's session.
+
+        Call at a Streamlit rerun boundary or Prefect task exit so the
+        thread-local session doesn't outlive its unit of work.
+        """
+        if self.SessionLocal:
+            self.SessionLocal.remove()
+
     def test_connection(self) -> bool:
         """
         Test the database connection.
@@ -170,4 +237,25 @@ class DatabaseManager:
             self.engine.dispose()
             logger.info("Database connections closed")
             self._initialized = False
-            DatabaseManager._instance = None
\ No newline at end of file
+            DatabaseManager._instance = None
+            _instances.pop(os.getpid(), None)
+
+
+# Per-PID cache so forked Dask/Prefect workers never share a parent's
+# engine (pooled connections must not cross a fork boundary)
+_instances: Dict[int, DatabaseManager] = {}
+
+
+def get_db_manager() -> DatabaseManager:
+    """Return the process-wide DatabaseManager, creating it on first use."""
+    pid = os.getpid()
+    instance = _instances.get(pid)
+    if instance is None:
+        # A forked child inherits the class-level singleton already marked
+        # initialized; discard it so this process builds its own engine
+        # instead of reusing the parent's pooled connections
+        stale = DatabaseManager._instance
+        if stale is not None and getattr(stale, '_pid', None) != pid:
+            DatabaseManager._instance = None
+        instance = _instances[pid] = DatabaseManager()
+    return instance
\ No newline at end of file
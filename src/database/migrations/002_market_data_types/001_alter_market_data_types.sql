@@ -0,0 +1,9 @@
+-- Narrow price columns to single precision and widen volume to BIGINT
+-- REAL halves the bytes scanned for charting queries; BIGINT prevents
+-- int32 overflow for cumulative/index volumes
+ALTER TABLE market_data
+    ALTER COLUMN open TYPE REAL,
+    ALTER COLUMN high TYPE REAL,
+    ALTER COLUMN low TYPE REAL,
+    ALTER COLUMN close TYPE REAL,
+    ALTER COLUMN volume TYPE BIGINT;
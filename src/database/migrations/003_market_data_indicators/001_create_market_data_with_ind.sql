@@ -0,0 +1,73 @@
+-- Server-side indicator view: moving averages via window functions and
+-- the MACD EMA chain via a recursive CTE. Lets readers pull bars with
+-- indicators precomputed in C on the server instead of shipping raw
+-- rows and recomputing client-side.
+CREATE OR REPLACE VIEW market_data_with_ind AS
+WITH RECURSIVE ordered AS (
+    SELECT
+        symbol,
+        timestamp,
+        open,
+        high,
+        low,
+        close,
+        volume,
+        ROW_NUMBER() OVER (PARTITION BY symbol ORDER BY timestamp) AS rn,
+        AVG(close) OVER (
+            PARTITION BY symbol ORDER BY timestamp
+            ROWS BETWEEN 4 PRECEDING AND CURRENT ROW
+        ) AS ma5,
+        AVG(close) OVER (
+            PARTITION BY symbol ORDER BY timestamp
+            ROWS BETWEEN 19 PRECEDING AND CURRENT ROW
+        ) AS ma20
+    FROM market_data
+),
+ema AS (
+    -- Seed each symbol's EMAs with its first close (adjust=False semantics)
+    SELECT
+        symbol, timestamp, rn,
+        close::double precision AS ema12,
+        close::double precision AS ema26
+    FROM ordered
+    WHERE rn = 1
+    UNION ALL
+    SELECT
+        o.symbol, o.timestamp, o.rn,
+        (2.0 / 13) * o.close + (11.0 / 13) * e.ema12,
+        (2.0 / 27) * o.close + (25.0 / 27) * e.ema26
+    FROM ordered o
+    JOIN ema e ON e.symbol = o.symbol AND o.rn = e.rn + 1
+),
+macd AS (
+    SELECT
+        symbol, timestamp, rn,
+        ema12 - ema26 AS macd
+    FROM ema
+),
+signal AS (
+    SELECT symbol, timestamp, rn, macd,
+           macd AS macd_signal
+    FROM macd
+    WHERE rn = 1
+    UNION ALL
+    SELECT m.symbol, m.timestamp, m.rn, m.macd,
+           (2.0 / 10) * m.macd + (8.0 / 10) * s.macd_signal
+    FROM macd m
+    JOIN signal s ON s.symbol = m.symbol AND m.rn = s.rn + 1
+)
+SELECT
+    o.symbol,
+    o.timestamp,
+    o.open,
+    o.high,
+    o.low,
+    o.close,
+    o.volume,
+    o.ma5,
+    o.ma20,
+    s.macd,
+    s.macd_signal,
+    s.macd - s.macd_signal AS macd_hist
+FROM ordered o
+JOIN signal s ON s.symbol = o.symbol AND s.rn = o.rn;
@@ -2,11 +2,14 @@
 Database models for the trading system.
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, create_engine, Float, Boolean, UniqueConstraint
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Text, create_engine, Float, Boolean, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
 
+# Single-precision float (PostgreSQL REAL) for price columns
+PRICE_TYPE = Float(precision=24)
+
 class Log(Base):
     """Model for storing application logs."""
     __tablename__ = 'logs'
@@ -50,15 +53,21 @@ class MarketData(Base):
     __tablename__ = "market_data"
 
     id = Column(Integer, primary_key=True)
-    symbol = Column(String, nullable=False, index=True)
+    # No single-column index on symbol: the composite unique index below has
+    # symbol as its leading column and serves the same lookups
+    symbol = Column(String, nullable=False)
     timestamp = Column(DateTime, nullable=False, index=True)
-    open = Column(Float, nullable=False)
-    high = Column(Float, nullable=False)
-    low = Column(Float, nullable=False)
-    close = Column(Float, nullable=False)
-    volume = Column(Integer, nullable=False)
+    # Single-precision REAL halves the bytes scanned on the chart read path;
+    # charting does not need more than ~7 significant digits
+    open = Column(PRICE_TYPE, nullable=False)
+    high = Column(PRICE_TYPE, nullable=False)
+    low = Column(PRICE_TYPE, nullable=False)
+    close = Column(PRICE_TYPE, nullable=False)
+    # BIGINT: cumulative/index volumes can overflow int32
+    volume = Column(BigInteger, nullable=False)
 
-    # Add unique constraint on symbol and timestamp
+    # Unique constraint on (symbol, timestamp) backs the ON CONFLICT upsert
+    # and the WHERE symbol = ? ORDER BY timestamp analytics queries
     __table_args__ = (
         UniqueConstraint('symbol', 'timestamp', name='uix_market_data_symbol_timestamp'),
     )
@@ -6,8 +6,8 @@ import pandas as pd
 from datetime import datetime, timedelta
 from loguru import logger
 
-from src.data.symbol_manager import SymbolManager
 from src.ui.components.chart_display import display_chart
+from src.ui.components.symbol_selector import _cached_active_symbols
 from src.ui.state.market_data_state import (
     get_market_data,
     get_latest_price,
@@ -18,8 +18,6 @@ from src.ui.state.market_data_state import (
 from src.ui.components.data_display import format_refresh_time
 
 
-
-
 def render_analysis():
     """Render the analysis page."""
     st.title("Technical Analysis")
@@ -35,6 +33,9 @@ def render_analysis():
             # Add refresh button
             if st.button("🔄 Refresh Data"):
                 st.session_state.force_refresh = True
+                # Invalidate the session-scoped caches as well
+                st.session_state.pop('active_symbols', None)
+                get_company_info.clear()
 
             # Display last refresh time if a symbol is selected
             if 'selected_symbol' in st.session_state:
@@ -43,8 +44,11 @@ def render_analysis():
                     st.write(f"Last updated: {format_refresh_time(last_refresh)}")
 
         with col2:
-            # Symbol selector
-            symbols = SymbolManager.get_active_symbols()
+            # Symbol selector; read once per session so slider/checkbox
+            # reruns never touch the database
+            if 'active_symbols' not in st.session_state:
+                st.session_state.active_symbols = _cached_active_symbols()
+            symbols = st.session_state.active_symbols
             selected_symbol = st.selectbox(
                 "Select Symbol",
                 options=symbols,
@@ -113,10 +117,12 @@ def render_analysis():
         if selected_symbol:
             st.header(f"Technical Analysis: {selected_symbol}")
 
-            # Get data from state management
+            # Get data from state management; the page only charts the
+            # recent window, so cap the rows fetched
             data = get_market_data(
                 selected_symbol,
-                force_refresh=st.session_state.get('force_refresh', False)
+                force_refresh=st.session_state.get('force_refresh', False),
+                limit=500
             )
 
             # Reset force refresh flag
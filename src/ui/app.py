@@ -15,6 +15,40 @@ from src.ui.home import render_home
 from src.ui.analysis import render_analysis
 from src.ui.settings import render_settings
 
+# Constant per-rerun payloads hoisted to module scope so the script rerun
+# only re-emits them instead of rebuilding the strings/dicts each time
+_CSS = """
+    <style>
+    .main {
+        padding: 0rem 1rem;
+    }
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 2rem;
+    }
+    .stTabs [data-baseweb="tab"] {
+        height: 4rem;
+        white-space: pre-wrap;
+        background-color: #f0f2f6;
+        border-radius: 4px 4px 0px 0px;
+        gap: 1rem;
+        padding-top: 10px;
+        padding-bottom: 10px;
+    }
+    .stTabs [aria-selected="true"] {
+        background-color: #ffffff;
+    }
+    </style>
+"""
+
+_MENU_KWARGS = dict(
+    menu_title="Trading System",
+    options=["Home", "Analysis", "Settings"],
+    icons=["house", "graph-up", "gear"],
+    menu_icon="chart-line",
+    default_index=0,
+)
+
+
 def main():
     """Main application entry point."""
     # Configure the page - MOVE THIS TO TOP LEVEL AND CALL ONLY ONCE
@@ -27,38 +61,11 @@ def main():
     )
 
     # Custom CSS
-    st.markdown("""
-        <style>
-        .main {
-            padding: 0rem 1rem;
-        }
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 2rem;
-        }
-        .stTabs [data-baseweb="tab"] {
-            height: 4rem;
-            white-space: pre-wrap;
-            background-color: #f0f2f6;
-            border-radius: 4px 4px 0px 0px;
-            gap: 1rem;
-            padding-top: 10px;
-            padding-bottom: 10px;
-        }
-        .stTabs [aria-selected="true"] {
-            background-color: #ffffff;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_CSS, unsafe_allow_html=True)
 
     # Navigation using option_menu
     with st.sidebar:
-        selected = option_menu(
-            menu_title="Trading System",
-            options=["Home", "Analysis", "Settings"],
-            icons=["house", "graph-up", "gear"],
-            menu_icon="chart-line",
-            default_index=0,
-        )
+        selected = option_menu(**_MENU_KWARGS)
 
     # Render the selected page
     if selected == "Home":
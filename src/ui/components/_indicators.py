@@ -0,0 +1,152 @@
+"""
+Vectorized indicator kernels for the chart components.
+
+Computing the moving averages and MACD on raw NumPy arrays keeps the
+per-rerun chart path free of repeated pandas dispatch; everything here
+is O(n) in the number of bars.
+"""
+import numpy as np
+import pandas as pd
+
+
+def _as_float_array(values: np.ndarray) -> np.ndarray:
+    """Contiguous float view of the input, preserving float32.
+
+    The state layer ships OHLC columns as float32; keeping that width
+    halves the bytes these memory-bound kernels stream, while the
+    rolling sums below still accumulate in float64.
+    """
+    values = np.ascontiguousarray(values)
+    if values.dtype not in (np.float32, np.float64):
+        values = values.astype(np.float64)
+    return values
+
+
+def _sliding_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average via a running cumulative sum.
+
+    One pass regardless of window size; positions before the window is
+    full are NaN, matching pandas' rolling(...).mean().
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    if n < window:
+        return out
+    csum = np.cumsum(values, dtype=np.float64)
+    out[window - 1] = csum[window - 1] / window
+    out[window:] = (csum[window:] - csum[:-window]) / window
+    return out
+
+
+# Truncate EMA kernels where the residual weight drops below this; the
+# tail beyond that point contributes less than 0.01% of the output
+_EMA_TAIL_WEIGHT = 1e-4
+
+
+def _ewm_mean(values: np.ndarray, span: int) -> np.ndarray:
+    """Exponential moving average matching pandas ewm(span, adjust=False).
+
+    The geometric weights decay fast enough that the kernel can be cut
+    off once its residual mass is below _EMA_TAIL_WEIGHT (~55 taps for
+    span=12, ~120 for span=26), turning the sequential recurrence into
+    one SIMD convolution. The first K outputs, where truncation would
+    actually bite, use the exact recurrence instead.
+    """
+    alpha = 2.0 / (span + 1.0)
+    n = values.shape[0]
+    kernel_len = int(np.ceil(np.log(_EMA_TAIL_WEIGHT) / np.log(1.0 - alpha)))
+    if n <= kernel_len:
+        return pd.Series(values).ewm(span=span, adjust=False).mean().to_numpy()
+
+    weights = alpha * (1.0 - alpha) ** np.arange(kernel_len)
+    out = np.convolve(values, weights)[:n]
+    # Renormalize for the truncated tail mass so the steady state is unbiased
+    out /= weights.sum()
+    out[:kernel_len] = (
+        pd.Series(values[:kernel_len]).ewm(span=span, adjust=False).mean().to_numpy()
+    )
+    return out
+
+
+def compute_sma(close: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average over closing prices.
+
+    Thin wrapper over the cumsum sliding window so chart code never
+    builds a pandas Rolling object per rerun.
+
+    Args:
+        close: 1-D array of closing prices in chart order
+        period: Averaging window
+
+    Returns:
+        float64 array with NaN until the window fills
+    """
+    return _sliding_mean(_as_float_array(close), period)
+
+
+def compute_rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Relative Strength Index over closing prices, fully vectorized.
+
+    Gains/losses come from one diff pass and the averages reuse the
+    cumsum sliding window, so no per-element Python loop runs. Positions
+    before the window fills are NaN.
+
+    Args:
+        close: 1-D array of closing prices in chart order
+        period: Averaging window (default 14)
+
+    Returns:
+        float64 array of RSI values in [0, 100]
+    """
+    close = _as_float_array(close)
+    delta = np.diff(close, prepend=close[:1])
+    delta[0] = 0.0
+    avg_gain = _sliding_mean(np.where(delta > 0, delta, 0.0), period)
+    avg_loss = _sliding_mean(np.where(delta < 0, -delta, 0.0), period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        # A lossless window means pure upward movement
+        rsi = np.where(avg_loss == 0.0, 100.0, rsi)
+    rsi[np.isnan(avg_gain)] = np.nan
+    return rsi
+
+
+def compute_sma_rsi(close: np.ndarray, sma_period=None, rsi_period=None):
+    """Compute the SMA and RSI together over one close buffer.
+
+    Both indicators stream the same array; fusing them coerces the
+    input once and keeps the buffer hot in cache between the two
+    windowed passes instead of re-reading it from RAM.
+
+    Args:
+        close: 1-D array of closing prices in chart order
+        sma_period: SMA window, or None to skip
+        rsi_period: RSI window, or None to skip
+
+    Returns:
+        Tuple (sma, rsi); each entry is None when its period was None
+    """
+    close = _as_float_array(close)
+    sma = _sliding_mean(close, sma_period) if sma_period else None
+    rsi = compute_rsi(close, rsi_period) if rsi_period else None
+    return sma, rsi
+
+
+def compute_macd_ma(close: np.ndarray):
+    """Compute MA5, MA20, MACD, signal, and histogram from closing prices.
+
+    Args:
+        close: 1-D array of closing prices in chart order
+
+    Returns:
+        Tuple of float64 arrays: (ma5, ma20, macd, macd_signal, macd_hist)
+    """
+    close = _as_float_array(close)
+    ma5 = _sliding_mean(close, 5)
+    ma20 = _sliding_mean(close, 20)
+    exp1 = _ewm_mean(close, 12)
+    exp2 = _ewm_mean(close, 26)
+    macd = exp1 - exp2
+    macd_signal = _ewm_mean(macd, 9)
+    macd_hist = macd - macd_signal
+    return ma5, ma20, macd, macd_signal, macd_hist
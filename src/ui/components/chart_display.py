@@ -2,12 +2,117 @@ import streamlit as st
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from loguru import logger
+import numpy as np
 import pandas as pd
 from typing import Optional, Dict, Any
 
+from src.ui.components._indicators import compute_macd_ma, compute_sma_rsi
 from src.ui.state.market_data_state import get_market_data
 
 
+# Hashing the full frame on every rerun would cost more than the figure
+# build; length + newest bar + last close is enough to detect data changes
+_CHART_DATA_HASH_FUNCS = {
+    pd.DataFrame: lambda d: (len(d), str(d.index.max()), float(d['close'].iloc[-1]))
+}
+
+
+# Static two-row subplot skeleton (axis domains, shared x) generated once
+# at import; per-call figures start from this dict instead of re-running
+# make_subplots
+_SUBPLOT_LAYOUT = make_subplots(
+    rows=2, cols=1, shared_xaxes=True,
+    vertical_spacing=0.05,
+    row_heights=[10, 10]
+).layout.to_plotly_json()
+
+# Three-row variant used when an RSI panel is requested
+_SUBPLOT_LAYOUT_RSI = make_subplots(
+    rows=3, cols=1, shared_xaxes=True,
+    vertical_spacing=0.05,
+    row_heights=[10, 10, 6]
+).layout.to_plotly_json()
+
+# Range selector buttons never change; build the list once at import
+_RANGE_SELECTOR_BUTTONS = [
+    dict(count=1, label="1M", step="month", stepmode="backward"),
+    dict(count=3, label="3M", step="month", stepmode="backward"),
+    dict(count=6, label="6M", step="month", stepmode="backward"),
+    dict(step="year", stepmode="todate", label="YTD"),
+    dict(count=1, label="1Y", step="year", stepmode="backward"),
+    dict(step="all", label="All")
+]
+
+
+# Static layout for the simplified chart; per-call code only fills in
+# the title and the x-axis range, instead of rebuilding every nested
+# dict (rangebreaks, rangeselector, fonts) on each rerun
+_SIMPLIFIED_LAYOUT = dict(
+    height=600,
+    width=1000,
+    title_font_color="#444",
+    title_font_size=24,
+    yaxis=dict(
+        title="Price",
+        title_font_color="#444",
+        title_font_size=20,
+        showgrid=True
+    ),
+    xaxis=dict(
+        rangeslider=dict(visible=False),
+        rangebreaks=[
+            # Hide weekends
+            dict(bounds=["sat", "mon"]),
+            # Hide hours outside 9:30 AM to 4:00 PM
+            dict(bounds=[16, 9.5], pattern="hour")
+        ],
+        showgrid=False,
+        showticklabels=True,
+        rangeselector=dict(
+            buttons=_RANGE_SELECTOR_BUTTONS,
+            bgcolor='lightgray',
+            x=0, xanchor='left',
+            y=1.15, yanchor='top',
+            font=dict(size=12)
+        ),
+        type="date"
+    )
+)
+
+
+# Browsers render ~2000 candles indistinguishably from 20000; above this
+# the JSON payload and client-side drawing dominate chart latency
+_MAX_CHART_POINTS = 2000
+
+
+def _bucket_ohlc(data: pd.DataFrame, step: int) -> pd.DataFrame:
+    """Aggregate OHLC bars into fixed-size buckets of `step` rows.
+
+    Keeps the visual envelope (true high/low per bucket, opening and
+    closing price at the bucket edges) while cutting the trace payload
+    by the bucket factor.
+    """
+    ascending = data.index.is_monotonic_increasing
+    buckets = np.arange(len(data)) // step
+    return data.groupby(buckets).agg({
+        'open': 'first' if ascending else 'last',
+        'high': 'max',
+        'low': 'min',
+        'close': 'last' if ascending else 'first',
+    })
+
+
+def _f32(values) -> np.ndarray:
+    """Hand numeric trace data to Plotly as float32 NumPy arrays.
+
+    Plotly serializes NumPy arrays as base64 typed arrays instead of
+    stringified floats, so float32 inputs cut the websocket payload
+    roughly 4x per column; chart rendering never needs float64.
+    """
+    return np.asarray(values, dtype=np.float32)
+
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False, hash_funcs=_CHART_DATA_HASH_FUNCS)
 def create_candlestick_chart(
     data: pd.DataFrame,
     symbol: str,
@@ -23,148 +128,150 @@ def create_candlestick_chart(
     Returns:
         go.Figure: The configured Plotly figure
     """
-    # Calculate technical indicators
-    data = data.copy()
-    
-    # Calculate moving averages
-    data['MA5'] = data['close'].rolling(window=5).mean()
-    data['MA20'] = data['close'].rolling(window=20).mean()
-    
-    # Calculate MACD
-    exp1 = data['close'].ewm(span=12, adjust=False).mean()
-    exp2 = data['close'].ewm(span=26, adjust=False).mean()
-    data['macd'] = exp1 - exp2
-    data['macd_signal'] = data['macd'].ewm(span=9, adjust=False).mean()
-    data['macd_hist'] = data['macd'] - data['macd_signal']
-
-    fig = go.Figure()
-    fig = make_subplots(rows=2, cols=1, shared_xaxes=True,
-                        vertical_spacing=0.05,
-                        row_heights=[10, 10])
-
-    # Add candlestick trace
-    fig.add_trace(go.Candlestick(
-        x=data.index if isinstance(data.index, pd.DatetimeIndex) else data['timestamp'],
-        open=data['open'],
-        high=data['high'],
-        low=data['low'],
-        close=data['close'],
-        name='OHLC'))
-
-    # add moving average traces
-    fig.add_trace(go.Scatter(x=data.index if isinstance(data.index, pd.DatetimeIndex) else data['timestamp'],
-                             y=data['MA5'],
-                             opacity=0.7,
-                             line=dict(color='blue', width=2),
-                             name='MA 5'))
-    fig.add_trace(go.Scatter(x=data.index if isinstance(data.index, pd.DatetimeIndex) else data['timestamp'],
-                             y=data['MA20'],
-                             opacity=0.7,
-                             line=dict(color='orange', width=2),
-                             name='MA 20'))
-
-    # Plot MACD trace on 2nd row
-    fig.add_trace(go.Scatter(x=data.index if isinstance(data.index, pd.DatetimeIndex) else data['timestamp'],
-                             y=data['macd'],
-                             line=dict(color='black', width=2),
-                             name='MACD'), row=2, col=1)
-
-    fig.add_trace(go.Scatter(x=data.index if isinstance(data.index, pd.DatetimeIndex) else data['timestamp'],
-                             y=data['macd_signal'],
-                             line=dict(color='skyblue', width=2),
-                             name='MACD Signal'), row=2, col=1)
-
-    colors = ['green' if val >= 0
-              else 'red' for val in data['macd_hist']]
-
-    fig.add_trace(go.Bar(x=data.index if isinstance(data.index, pd.DatetimeIndex) else data['timestamp'],
-                         y=data['macd_hist'],
-                         marker_color=colors,
-                         name='Histogram'
-                         ), row=2, col=1)
-
-    # hide weekends and xaxes
-    fig.update_xaxes(rangebreaks=[dict(bounds=["sat", "mon"])], showgrid=False)
-    fig.update_xaxes(visible=True, showticklabels=False)
-    fig.update_yaxes(title_text="OHLC", showgrid=True, row=1, col=1,
-                     title_font_color="#444", title_font_size=20)
-    fig.update_yaxes(title_text="MACD/Signal/Hist", showgrid=True, row=2, col=1,
-                     title_font_color="#444", title_font_size=20)
-    fig.update_layout(height=900,
-                      width=1000,
-                      xaxis_rangeslider_visible=False,
-                      title=f"{symbol}<br><sup>2025</sup>",
-                      title_font_color="#f00", title_font_size=24)
-
-    fig.update_layout({
+    # Calculate technical indicators on the raw close array in one shot;
+    # the results stay as NumPy arrays handed straight to the traces, so
+    # the input frame is never copied or mutated. The state layer ships
+    # float32 — the kernels keep that width rather than upcasting
+    close = data['close'].to_numpy()
+    ma5, ma20, macd, macd_signal, macd_hist = compute_macd_ma(close)
+
+    # get_market_data guarantees a DatetimeIndex, so the x axis is one
+    # datetime64 buffer shared by every trace with no type branching
+    x = data.index.to_numpy()
+
+    # Downsample to the viewport budget: indicators are computed on the
+    # full series above, then strided; the candles are bucket-aggregated
+    # so highs/lows survive
+    n = len(data)
+    if n > _MAX_CHART_POINTS:
+        step = -(-n // _MAX_CHART_POINTS)
+        ohlc = _bucket_ohlc(data, step)
+        x = x[::step]
+        ma5, ma20 = ma5[::step], ma20[::step]
+        macd, macd_signal, macd_hist = macd[::step], macd_signal[::step], macd_hist[::step]
+    else:
+        step = 1
+        ohlc = data
+
+    # Vectorized select instead of boxing every float through Python
+    colors = np.where(macd_hist >= 0, 'green', 'red')
+
+    # Plain trace dicts skip graph_objects' per-attribute validators, and
+    # handing them to one Figure constructor runs validation a single
+    # time instead of once per add_trace; explicit axis keys replace the
+    # row/col dispatch (row 2 is the MACD panel)
+    traces = [
+        dict(type='candlestick',
+             x=x,
+             open=_f32(ohlc['open']),
+             high=_f32(ohlc['high']),
+             low=_f32(ohlc['low']),
+             close=_f32(ohlc['close']),
+             name='OHLC',
+             xaxis='x', yaxis='y'),
+        dict(type='scatter',
+             x=x,
+             y=_f32(ma5),
+             opacity=0.7,
+             line=dict(color='blue', width=2),
+             name='MA 5',
+             xaxis='x', yaxis='y'),
+        dict(type='scatter',
+             x=x,
+             y=_f32(ma20),
+             opacity=0.7,
+             line=dict(color='orange', width=2),
+             name='MA 20',
+             xaxis='x', yaxis='y'),
+        dict(type='scatter',
+             x=x,
+             y=_f32(macd),
+             line=dict(color='black', width=2),
+             name='MACD',
+             xaxis='x2', yaxis='y2'),
+        dict(type='scatter',
+             x=x,
+             y=_f32(macd_signal),
+             line=dict(color='skyblue', width=2),
+             name='MACD Signal',
+             xaxis='x2', yaxis='y2'),
+        dict(type='bar',
+             x=x,
+             y=_f32(macd_hist),
+             marker_color=colors,
+             name='Histogram',
+             xaxis='x2', yaxis='y2'),
+    ]
+
+    # Optional indicators from the analysis-page controls, computed in
+    # one fused pass over the close buffer
+    indicators = indicators or {}
+    sma_period = indicators.get('sma', {}).get('period')
+    rsi_period = indicators.get('rsi', {}).get('period')
+    if sma_period or rsi_period:
+        sma, rsi = compute_sma_rsi(close, sma_period, rsi_period)
+    if sma_period:
+        traces.append(dict(type='scatter',
+                           x=x,
+                           y=_f32(sma[::step]),
+                           opacity=0.7,
+                           line=dict(color='darkgreen', width=2),
+                           name=f'SMA {sma_period}',
+                           xaxis='x', yaxis='y'))
+    if rsi_period:
+        traces.append(dict(type='scatter',
+                           x=x,
+                           y=_f32(rsi[::step]),
+                           line=dict(color='purple', width=2),
+                           name=f'RSI {rsi_period}',
+                           xaxis='x3', yaxis='y3'))
+
+    fig = go.Figure(
+        data=traces,
+        layout=_SUBPLOT_LAYOUT_RSI if rsi_period else _SUBPLOT_LAYOUT
+    )
+
+    # One layout dict, one update pass; axis settings address the subplot
+    # axes directly (hide weekends and tick labels, title each panel)
+    _x_axis = {
+        'rangebreaks': [dict(bounds=["sat", "mon"])],
+        'showgrid': False,
+        'visible': True,
+        'showticklabels': False
+    }
+    layout_update = {
+        'height': 900,
+        'width': 1000,
+        'xaxis': dict(_x_axis, rangeslider={'visible': False}),
+        'xaxis2': dict(_x_axis),
+        'yaxis': {
+            'title': {'text': "OHLC", 'font': {'color': "#444", 'size': 20}},
+            'showgrid': True
+        },
+        'yaxis2': {
+            'title': {'text': "MACD/Signal/Hist", 'font': {'color': "#444", 'size': 20}},
+            'showgrid': True
+        },
+        'title': f"{symbol}<br><sup>2025</sup>",
+        'title_font_color': "#f00",
+        'title_font_size': 24,
         'plot_bgcolor': 'rgb(247,247,247)',
         'paper_bgcolor': 'rgb(247,247,247)'
-    })
+    }
+    if rsi_period:
+        layout_update['xaxis3'] = dict(_x_axis)
+        layout_update['yaxis3'] = {
+            'title': {'text': "RSI", 'font': {'color': "#444", 'size': 20}},
+            'showgrid': True,
+            'range': [0, 100]
+        }
+    fig.update_layout(layout_update)
 
     return fig
 
 
-# def create_candlestick_chart_simplified(
-#         data: pd.DataFrame,
-#         symbol: str,
-#         indicators: Optional[Dict[str, Any]] = None
-# ) -> go.Figure:
-#     """Create a simplified candlestick chart.
-#
-#     Args:
-#         data: DataFrame containing OHLCV data
-#         symbol: The stock symbol
-#         indicators: Optional dictionary of indicators to add to the chart
-#
-#     Returns:
-#         go.Figure: The configured Plotly figure
-#     """
-#     # Calculate technical indicators
-#     data = data.copy()
-#
-#     # Create figure
-#     fig = go.Figure()
-#
-#     # Add candlestick trace
-#     fig.add_trace(go.Candlestick(
-#         x=data.index if isinstance(data.index, pd.DatetimeIndex) else data['timestamp'],
-#         open=data['open'],
-#         high=data['high'],
-#         low=data['low'],
-#         close=data['close'],
-#         name='OHLC'))
-#
-#     # Configure layout
-#     fig.update_layout(
-#         height=600,  # Reduced height since we don't have subplots
-#         width=1000,
-#         xaxis_rangeslider_visible=False,
-#         title=f"{symbol}<br><sup>2025</sup>",
-#         title_font_color="#444",
-#         title_font_size=24,
-#         plot_bgcolor='rgb(247,247,247)',
-#         paper_bgcolor='rgb(247,247,247)',
-#         yaxis=dict(
-#             title="Price",
-#             title_font_color="#444",
-#             title_font_size=20,
-#             showgrid=True
-#         ),
-#         xaxis=dict(
-#             rangebreaks=[dict(bounds=["sat", "mon"])],
-#             showgrid=False,
-#             showticklabels=True  # Show x-axis labels
-#         )
-#     )
-#
-#     return fig
-
-
-
-import pandas as pd
-import plotly.graph_objects as go
-from typing import Optional, Dict, Any
 
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False, hash_funcs=_CHART_DATA_HASH_FUNCS)
 def create_candlestick_chart_simplified(
         data: pd.DataFrame,
         symbol: str,
@@ -180,73 +287,38 @@ def create_candlestick_chart_simplified(
     Returns:
         go.Figure: The configured Plotly figure
     """
-    # Ensure datetime index
-    data = data.copy()
-    if not isinstance(data.index, pd.DatetimeIndex):
-        data['timestamp'] = pd.to_datetime(data['timestamp'])
-        data.set_index('timestamp', inplace=True)
+    # get_market_data guarantees a DatetimeIndex
+    x = data.index
 
     # Calculate bounds from data
     start_date = pd.Timestamp("2025-01-01")
-    end_date = data.index.max()
-
-    # Create figure
-    fig = go.Figure()
-
-    # Add candlestick trace
-    fig.add_trace(go.Candlestick(
-        x=data.index,
-        open=data['open'],
-        high=data['high'],
-        low=data['low'],
-        close=data['close'],
-        name='OHLC'))
-
-    # Define range selector buttons limited to 2025
-    range_selector_buttons = [
-        dict(count=1, label="1M", step="month", stepmode="backward"),
-        dict(count=3, label="3M", step="month", stepmode="backward"),
-        dict(count=6, label="6M", step="month", stepmode="backward"),
-        dict(step="year", stepmode="todate", label="YTD"),
-        dict(count=1, label="1Y", step="year", stepmode="backward"),
-        dict(step="all", label="All")
-    ]
-
-    # Configure layout
+    end_date = x.max()
+
+    # Bucket-aggregate down to the viewport budget
+    if len(data) > _MAX_CHART_POINTS:
+        step = -(-len(data) // _MAX_CHART_POINTS)
+        ohlc = _bucket_ohlc(data, step)
+        x = x[::step]
+    else:
+        ohlc = data
+
+    # Candlestick trace as a plain dict to skip per-attribute validation;
+    # the figure is built in one constructor call from the static layout
+    trace = dict(
+        type='candlestick',
+        x=x,
+        open=_f32(ohlc['open']),
+        high=_f32(ohlc['high']),
+        low=_f32(ohlc['low']),
+        close=_f32(ohlc['close']),
+        name='OHLC')
+
+    fig = go.Figure(data=[trace], layout=_SIMPLIFIED_LAYOUT)
+
+    # Only the per-call pieces are set dynamically
     fig.update_layout(
-        height=600,
-        width=1000,
-        xaxis_rangeslider_visible=False,
         title=f"{symbol}<br><sup>2025</sup>",
-        title_font_color="#444",
-        title_font_size=24,
-        #plot_bgcolor='rgb(247,247,247)',
-        #paper_bgcolor='rgb(247,247,247)',
-        yaxis=dict(
-            title="Price",
-            title_font_color="#444",
-            title_font_size=20,
-            showgrid=True
-        ),
-        xaxis=dict(
-            range=[start_date, end_date],  # Limit initial view to 2025 only
-            rangebreaks=[
-                # Hide weekends
-                dict(bounds=["sat", "mon"]),
-                # Hide hours outside 9:30 AM to 4:00 PM
-                dict(bounds=[16, 9.5], pattern="hour")
-            ],
-            showgrid=False,
-            showticklabels=True,
-            rangeselector=dict(
-                buttons=range_selector_buttons,
-                bgcolor='lightgray',
-                x=0, xanchor='left',
-                y=1.15, yanchor='top',
-                font=dict(size=12)
-            ),
-            type="date"
-        )
+        xaxis_range=[start_date, end_date]  # Limit initial view to 2025 only
     )
 
     return fig
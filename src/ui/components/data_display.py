@@ -1,35 +1,38 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
-from pytz import timezone as pytz_timezone
+from zoneinfo import ZoneInfo
 from loguru import logger
 from st_aggrid import AgGrid
 from st_aggrid.grid_options_builder import GridOptionsBuilder
 from typing import Optional, Dict, Any
 
 from src.ui.state.market_data_state import get_market_data
-from src.ui.components.date_display import format_datetime_est_to_cst
+from src.ui.components.date_display import format_datetime_est_to_cst, _DAY_SUFFIX
+
+# One shared zone object instead of a registry lookup per call; zoneinfo
+# is stdlib and C-accelerated
+_CST = ZoneInfo('America/Chicago')
 
 
 def format_refresh_time(dt: datetime) -> str:
     """Format refresh time in CST timezone consistently across the UI.
-    
+
     Args:
         dt: The datetime to format (assumed to be in CST)
-        
+
     Returns:
         str: Formatted datetime string in CST
     """
     # Ensure the datetime is in CST
-    cst_zone = pytz_timezone('US/Central')
     if dt.tzinfo is None:
-        dt = cst_zone.localize(dt)
+        dt = dt.replace(tzinfo=_CST)
     else:
-        dt = dt.astimezone(cst_zone)
+        dt = dt.astimezone(_CST)
     
     # Format the datetime
     day = dt.day
-    suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th') if day not in (11, 12, 13) else 'th'
+    suffix = _DAY_SUFFIX[day]
     month = dt.strftime("%B")
     year = dt.year
     hour = dt.strftime("%I").lstrip("0") or "12"  # Remove leading zero
@@ -47,30 +50,45 @@ def create_metrics_display(data: pd.DataFrame) -> None:
     """
     col1, col2, col3, col4, col5 = st.columns(5)
 
+    # One row lookup for the prices instead of four separate Series
+    # dispatches; volume stays its own lookup so it keeps its int dtype
+    open_, high, low, close = data[['open', 'high', 'low', 'close']].iloc[0]
+    volume = data['volume'].iloc[0]
+
     with col1:
-        st.metric("Open", f"${data['open'].iloc[0]:.2f}")
+        st.metric("Open", f"${open_:.2f}")
     with col2:
-        st.metric("High", f"${data['high'].iloc[0]:.2f}")
+        st.metric("High", f"${high:.2f}")
     with col3:
-        st.metric("Low", f"${data['low'].iloc[0]:.2f}")
+        st.metric("Low", f"${low:.2f}")
     with col4:
-        st.metric("Close", f"${data['close'].iloc[0]:.2f}")
+        st.metric("Close", f"${close:.2f}")
     with col5:
-        st.metric("Volume", f"{data['volume'].iloc[0]:,}")
+        st.metric("Volume", f"{volume:,}")
+
+
+# The grid shows 10 rows a page; shipping the full history to the
+# browser just to page through it client-side wastes the whole payload
+TABLE_MAX_ROWS = 100
 
 
 def create_data_table(data: pd.DataFrame) -> None:
     """Display data in an interactive table using AgGrid.
-    
+
     Args:
         data: DataFrame containing market data
     """
-    gb = GridOptionsBuilder.from_dataframe(data)
+    # Rows arrive newest-first, so the head is the recent data users page
+    # through; slicing before the grid keeps the JSON payload bounded
+    recent = data.iloc[:TABLE_MAX_ROWS]
+
+    gb = GridOptionsBuilder.from_dataframe(recent)
     gb.configure_pagination(enabled=True, paginationPageSize=10)
+    gb.configure_default_column(suppressMenu=True)
     gridoptions_table = gb.build()
 
     AgGrid(
-        data,
+        recent,
         gridOptions=gridoptions_table,
         enable_enterprise_modules=True,
         use_container_width=True,
@@ -1,7 +1,29 @@
 from datetime import datetime
-from pytz import timezone as pytz_timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 from typing import Union
 
+# Shared zone objects; ZoneInfo instances are cached by the constructor
+# and convert without pytz's localize() dance
+_EST_TZ = ZoneInfo('US/Eastern')
+_CST_TZ = ZoneInfo('US/Central')
+
+
+# Month names indexed by datetime.month; avoids a strftime format-string
+# parse per component
+_MONTH_NAMES = (None, "January", "February", "March", "April", "May", "June",
+                "July", "August", "September", "October", "November", "December")
+
+
+# Ordinal suffix per day of month (index 0 unused; 11/12/13 take 'th');
+# a table read replaces the range check and dict lookup per call
+_DAY_SUFFIX = (
+    'th', 'st', 'nd', 'rd', 'th', 'th', 'th', 'th', 'th', 'th',
+    'th', 'th', 'th', 'th', 'th', 'th', 'th', 'th', 'th', 'th',
+    'th', 'st', 'nd', 'rd', 'th', 'th', 'th', 'th', 'th', 'th',
+    'th', 'st'
+)
+
 
 def get_ordinal_suffix(day: int) -> str:
     """Return ordinal suffix for a day (st, nd, rd, th)
@@ -12,9 +34,34 @@ def get_ordinal_suffix(day: int) -> str:
     Returns:
         str: The appropriate ordinal suffix
     """
-    if 11 <= day <= 13:
-        return 'th'
-    return {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
+    return _DAY_SUFFIX[day]
+
+
+def _format_cst(cst_time: datetime) -> str:
+    """Format an already-CST datetime as '24th May, 2025 8:08 PM'.
+
+    Reads components directly; each strftime call re-parses its format
+    string, and none of these need one.
+    """
+    day = cst_time.day
+    suffix = _DAY_SUFFIX[day]
+    month = _MONTH_NAMES[cst_time.month]
+    h = cst_time.hour
+    hour = ((h - 1) % 12) + 1
+    ampm = "AM" if h < 12 else "PM"
+
+    return f"{day}{suffix} {month}, {cst_time.year} {hour}:{cst_time.minute:02d} {ampm}"
+
+
+@lru_cache(maxsize=256)
+def _format_epoch_minute(epoch_min: int) -> str:
+    """Format an epoch minute as a CST string, memoized.
+
+    The display string has minute resolution, so keying the cache on
+    epoch // 60 is lossless; Streamlit reruns format the same handful
+    of event times over and over, and repeats become a dict lookup.
+    """
+    return _format_cst(datetime.fromtimestamp(epoch_min * 60, _CST_TZ))
 
 
 def format_datetime_est_to_cst(dt: Union[datetime, str],
@@ -38,29 +85,61 @@ def format_datetime_est_to_cst(dt: Union[datetime, str],
         except ValueError as e:
             raise ValueError("Invalid datetime string format. Expected ISO format.") from e
 
-    est_zone = pytz_timezone(input_tz)
-    cst_zone = pytz_timezone('US/Central')
+    # Handle timezone-naive datetimes by assuming they're EST; aware
+    # inputs convert straight to CST — routing them through EST first
+    # would just be a second astimezone with the same end result
+    if dt.tzinfo is None:
+        est_zone = _EST_TZ if input_tz == 'US/Eastern' else ZoneInfo(input_tz)
+        dt = dt.replace(tzinfo=est_zone)
 
-    # Handle timezone-naive datetimes by assuming they're EST
+    # Convert to CST via the memoized minute formatter
+    return _format_epoch_minute(int(dt.timestamp()) // 60)
+
+
+def format_time_cst_only(dt: datetime) -> str:
+    """Format just the CST time portion as '8:08 PM'.
+
+    The hour labels on the dashboard only need the clock time; skipping
+    the day/month/ordinal work halves the formatter cost for them.
+
+    Args:
+        dt: A datetime object (naive datetimes are assumed EST)
+
+    Returns:
+        str: Time-of-day string in CST
+    """
     if dt.tzinfo is None:
-        dt = est_zone.localize(dt)
-    else:
-        # Convert to EST first if it's in another timezone
-        dt = dt.astimezone(est_zone)
+        dt = dt.replace(tzinfo=_EST_TZ)
+    cst_time = dt.astimezone(_CST_TZ)
+    h = cst_time.hour
+    hour = ((h - 1) % 12) + 1
+    ampm = "AM" if h < 12 else "PM"
+    return f"{hour}:{cst_time.minute:02d} {ampm}"
 
-    # Convert to CST
-    cst_time = dt.astimezone(cst_zone)
 
-    # Get components for custom formatting
-    day = cst_time.day
-    suffix = get_ordinal_suffix(day)
-    month = cst_time.strftime("%B")
-    year = cst_time.year
-    hour = cst_time.strftime("%I").lstrip("0") or "12"  # Remove leading zero
-    minute = cst_time.strftime("%M")
-    ampm = cst_time.strftime("%p")
+def format_many_est_to_cst(dts) -> list:
+    """Format several datetimes to CST strings in one pass.
 
-    return f"{day}{suffix} {month}, {year} {hour}:{minute} {ampm}"
+    Skips the per-call wrapper overhead (string parsing, zone
+    resolution) by converting inline against the module zone constants;
+    None entries pass through so callers can hand over optional event
+    times without pre-filtering.
+
+    Args:
+        dts: Iterable of datetime objects or None
+
+    Returns:
+        list: Formatted CST strings, None where the input was None
+    """
+    out = []
+    for dt in dts:
+        if dt is None:
+            out.append(None)
+        else:
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=_EST_TZ)
+            out.append(_format_epoch_minute(int(dt.timestamp()) // 60))
+    return out
 
 
 def get_current_cst() -> datetime:
@@ -69,7 +148,7 @@ def get_current_cst() -> datetime:
     Returns:
         datetime: Current datetime in CST timezone
     """
-    return datetime.now(pytz_timezone('US/Central'))
+    return datetime.now(_CST_TZ)
 
 
 def get_current_cst_formatted() -> str:
@@ -78,7 +157,8 @@ def get_current_cst_formatted() -> str:
     Returns:
         str: Formatted current CST datetime
     """
-    return format_datetime_est_to_cst(get_current_cst())
+    # Already CST — formatting directly skips the EST→CST round trip
+    return _format_cst(get_current_cst())
 
 
 def convert_est_to_cst(dt: Union[datetime, str]) -> datetime:
@@ -93,10 +173,7 @@ def convert_est_to_cst(dt: Union[datetime, str]) -> datetime:
     if isinstance(dt, str):
         dt = datetime.fromisoformat(dt)
 
-    est_zone = pytz_timezone('US/Eastern')
-    cst_zone = pytz_timezone('US/Central')
-
     if dt.tzinfo is None:
-        dt = est_zone.localize(dt)
+        dt = dt.replace(tzinfo=_EST_TZ)
 
-    return dt.astimezone(cst_zone)
\ No newline at end of file
+    return dt.astimezone(_CST_TZ)
\ No newline at end of file
@@ -1,90 +1,81 @@
 from datetime import datetime, timezone
 import streamlit as st
 from loguru import logger
-from pytz import timezone as pytz_timezone
 from typing import Optional, Dict, Any
 
 from src.utils.market_hours import MarketHoursManager
-from src.ui.components.date_display import format_datetime_est_to_cst
+from src.ui.components.date_display import format_many_est_to_cst, format_time_cst_only
 
 
-def get_ordinal_suffix(day):
-    """Return ordinal suffix for a day (st, nd, rd, th)"""
-    if 11 <= day <= 13:
-        return 'th'
-    return {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
+@st.cache_resource(show_spinner=False)
+def _get_market_hours_mgr() -> MarketHoursManager:
+    """Reuse one manager (and its API session) across reruns."""
+    return MarketHoursManager()
 
 
-def format_datetime_cst(dt):
-    """Format datetime in CST as '24th May, 2025 8:08 PM'"""
-    cst_zone = pytz_timezone('America/Chicago')
+@st.cache_data(ttl=30, show_spinner=False)
+def _market_snapshot(minute_key: str) -> Dict[str, Any]:
+    """Fetch all market-status fields once per TTL window.
 
-    # Handle both timezone-naive and timezone-aware datetimes
-    if dt.tzinfo is None:
-        dt = pytz_timezone('UTC').localize(dt)
-
-    cst_time = dt.astimezone(cst_zone)
-
-    # Get components for custom formatting
-    day = cst_time.day
-    suffix = get_ordinal_suffix(day)
-    month = cst_time.strftime("%B")
-    year = cst_time.year
-    hour = cst_time.strftime("%I").lstrip("0") or "12"  # Remove leading zero
-    minute = cst_time.strftime("%M")
-    ampm = cst_time.strftime("%p")
-
-    return f"{day}{suffix} {month}, {year} {hour}:{minute} {ampm}"
+    Keyed on the current minute so every widget tick within it reuses the
+    same clock/calendar answers instead of four API calls per rerun.
+    """
+    mgr = _get_market_hours_mgr()
+    return {
+        'is_open': mgr.is_market_open(),
+        'next_open': mgr.get_next_market_open(),
+        'next_close': mgr.get_next_market_close(),
+        'hours': mgr.get_market_hours(),
+    }
 
 
-def display_market_status_section(is_open: bool, current_time: datetime) -> None:
+def display_market_status_section(is_open: bool, current_time_str: str) -> None:
     """Display the market status section.
-    
+
     Args:
         is_open: Whether the market is currently open
-        current_time: Current time in UTC
+        current_time_str: Pre-formatted current time in CST
     """
     st.subheader("Market Status")
-    
+
     if is_open:
         st.success("Market is OPEN")
     else:
         st.error("Market is CLOSED")
-    
-    st.write(f"Current Time: {format_datetime_est_to_cst(current_time)}")
 
+    st.write(f"Current Time: {current_time_str}")
 
-def display_next_events(next_open: Optional[datetime], next_close: Optional[datetime]) -> None:
+
+def display_next_events(next_open_str: Optional[str], next_close_str: Optional[str]) -> None:
     """Display next market events.
-    
+
     Args:
-        next_open: Next market open time
-        next_close: Next market close time
+        next_open_str: Pre-formatted next market open time
+        next_close_str: Pre-formatted next market close time
     """
     st.subheader("Next Events")
-    
-    if next_open:
-        st.write(f"Next Open: {format_datetime_est_to_cst(next_open)}")
-    if next_close:
-        st.write(f"Next Close: {format_datetime_est_to_cst(next_close)}")
 
+    if next_open_str:
+        st.write(f"Next Open: {next_open_str}")
+    if next_close_str:
+        st.write(f"Next Close: {next_close_str}")
 
-def display_market_hours(hours: Optional[Dict[str, datetime]]) -> None:
+
+def display_market_hours(open_str: Optional[str], close_str: Optional[str]) -> None:
     """Display today's market hours.
-    
+
     Args:
-        hours: Dictionary containing market open and close times
+        open_str: Pre-formatted market open time, or None
+        close_str: Pre-formatted market close time, or None
     """
     st.subheader("Today's Market Hours")
-    
-    if hours:
+
+    if open_str and close_str:
         col1, col2 = st.columns(2)
         with col1:
-            time_str = format_datetime_est_to_cst(hours['open']).split(', ')[-1]
-            st.write(f"Open: {time_str}")
+            st.write(f"Open: {open_str}")
         with col2:
-            time_str = format_datetime_est_to_cst(hours['close']).split(', ')[-1]
-            st.write(f"Close: {time_str}")
+            st.write(f"Close: {close_str}")
     else:
         st.warning("No market hours available for today")
 
@@ -92,26 +83,31 @@ def display_market_hours(hours: Optional[Dict[str, datetime]]) -> None:
 def display_market_status() -> None:
     """Display current market status and hours with times in CST."""
     try:
-        market_hours = MarketHoursManager()
         current_time = datetime.now(timezone.utc)
-        
+        snapshot = _market_snapshot(current_time.strftime('%Y-%m-%dT%H:%M'))
+
+        # Format all event times in one pass sharing the zone constants;
+        # the hour labels only need the time portion
+        hours = snapshot['hours']
+        now_str, next_open_str, next_close_str = format_many_est_to_cst([
+            current_time,
+            snapshot['next_open'],
+            snapshot['next_close'],
+        ])
+        open_str = format_time_cst_only(hours['open']) if hours else None
+        close_str = format_time_cst_only(hours['close']) if hours else None
+
         # Create two columns for status and next events
         col1, col2 = st.columns(2)
-        
+
         with col1:
-            display_market_status_section(
-                market_hours.is_market_open(),
-                current_time
-            )
-        
+            display_market_status_section(snapshot['is_open'], now_str)
+
         with col2:
-            display_next_events(
-                market_hours.get_next_market_open(),
-                market_hours.get_next_market_close()
-            )
-        
+            display_next_events(next_open_str, next_close_str)
+
         # Display market hours
-        display_market_hours(market_hours.get_market_hours())
+        display_market_hours(open_str, close_str)
 
     except Exception as e:
         logger.error(f"Error displaying market status: {e}")
@@ -4,15 +4,21 @@ from loguru import logger
 from src.data.symbol_manager import SymbolManager
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_active_symbols() -> list:
+    """Fetch the active-symbol list once a minute instead of per rerun."""
+    return SymbolManager.get_active_symbols()
+
+
 def display_symbol_selector() -> str:
     """Display symbol selector component.
-    
+
     Returns:
         str: Selected symbol or None if no selection
     """
     try:
         # Get active symbols
-        symbols = SymbolManager.get_active_symbols()
+        symbols = _cached_active_symbols()
         
         if not symbols:
             st.warning("No active symbols found")
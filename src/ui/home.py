@@ -3,6 +3,7 @@ Home page for the trading system dashboard.
 """
 import streamlit as st
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 import pandas as pd
 from loguru import logger
 from sqlalchemy import text
@@ -79,10 +80,18 @@ def render_home():
         st.info("Please select a symbol to view market data")
 
 
+# Regular session bounds in minutes since midnight ET
+_MKT_OPEN_MIN = 9 * 60 + 30
+_MKT_CLOSE_MIN = 16 * 60
+_MKT_TZ = ZoneInfo("America/New_York")
+
+
 def is_market_open() -> bool:
     """Check if the market is currently open."""
-    now = datetime.now()
-    # Simple check for market hours (9:30 AM - 4:00 PM ET)
-    market_open = now.replace(hour=9, minute=30, second=0)
-    market_close = now.replace(hour=16, minute=0, second=0)
-    return market_open <= now <= market_close 
\ No newline at end of file
+    # Simple check for market hours (9:30 AM - 4:00 PM ET); one integer
+    # comparison on minutes-since-midnight instead of building two
+    # datetimes per call. The clock is read in ET — the old local-time
+    # read was wrong anywhere outside Eastern
+    now = datetime.now(_MKT_TZ)
+    minutes = now.hour * 60 + now.minute
+    return _MKT_OPEN_MIN <= minutes <= _MKT_CLOSE_MIN 
\ No newline at end of file
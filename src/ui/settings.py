@@ -13,10 +13,22 @@ from src.utils.config import get_config, update_config
 def render_settings():
     """Render the settings page."""
     st.title("System Settings")
-    
+
+    # One config read per render, shared by every widget below
+    config = get_config()
+    db_config = config.get("database", {})
+
+    # Batch all inputs in a form so edits don't trigger a rerun per
+    # keystroke — the page re-renders once, on submit
+    with st.form("settings_form"):
+        render_settings_form(config, db_config)
+
+
+def render_settings_form(config, db_config):
+    """Render the settings widgets inside the batched form."""
     # Create tabs for different settings
     tab1, tab2, tab3 = st.tabs(["Data Collection", "Trading", "System"])
-    
+
     with tab1:
         st.header("Data Collection Settings")
         
@@ -31,13 +43,18 @@ def render_settings():
         if data_source == "Alpaca":
             # Alpaca API settings
             st.subheader("Alpaca API Settings")
-            
-            # Get current config
-            config = get_config()
-            alpaca_config = config.get("alpaca", {})
-            
+
+            # Credential presence only needs computing once per session;
+            # the boolean is sticky until the session ends or the cache
+            # entry is popped (e.g. after a config save)
+            if "_alpaca_configured" not in st.session_state:
+                alpaca_config = config.get("alpaca", {})
+                st.session_state["_alpaca_configured"] = bool(
+                    alpaca_config.get("api_key") and alpaca_config.get("secret_key")
+                )
+
             # Display API configuration status
-            if alpaca_config.get("api_key") and alpaca_config.get("secret_key"):
+            if st.session_state["_alpaca_configured"]:
                 st.success("✅ API credentials configured")
             else:
                 st.warning("⚠️ API credentials not found in configuration")
@@ -71,7 +88,6 @@ def render_settings():
         
         # Database settings
         st.subheader("Database")
-        db_config = get_config().get("database", {})
         st.text_input("Host", value=db_config.get("host", "localhost"))
         st.number_input("Port", value=db_config.get("port", 5432))
         st.text_input("Database", value=db_config.get("name", "trading"))
@@ -89,6 +105,6 @@ def render_settings():
         st.number_input("Log Retention (days)", value=30, min_value=1)
     
     # Save button
-    if st.button("Save Settings"):
+    if st.form_submit_button("Save Settings"):
         st.success("Settings saved successfully!")
         # TODO: Implement settings save functionality 
\ No newline at end of file
@@ -8,69 +8,187 @@ from loguru import logger
 from sqlalchemy import text
 from typing import Optional, Dict, Any
 
-from src.database.db_manager import DatabaseManager
+from src.database.db_manager import DatabaseManager, get_db_manager
 
+# Copy-on-write makes shallow copies safe to hand out: a caller mutating
+# its frame triggers a copy instead of corrupting the shared cache
+pd.set_option("mode.copy_on_write", True)
 
-def get_market_data(symbol: str, force_refresh: bool = False) -> Optional[pd.DataFrame]:
+
+@st.cache_resource(show_spinner=False)
+def _db() -> DatabaseManager:
+    """Share one engine/pool across reruns instead of rebuilding per render."""
+    return get_db_manager()
+
+
+# cache_resource rather than cache_data: the frame is returned by
+# reference instead of being pickled per call, and copy-on-write plus
+# the shallow copy in get_market_data guard against aliasing
+@st.cache_resource(ttl=300, show_spinner=False)
+def _load_market_data(
+    symbol: str,
+    selected: tuple,
+    limit: Optional[int],
+    start: str = '2025-01-01',
+    end: Optional[str] = None
+) -> pd.DataFrame:
+    """Run the market-data SELECT, cached briefly across reruns.
+
+    read_sql_query materializes columns directly instead of building the
+    frame row by row; OHLC is downcast to float32, which is plenty for
+    display and halves the cached footprint. Bound parameters keep the
+    plan on the (symbol, timestamp) index for any date window.
+    """
+    query = f"""
+        SELECT {', '.join(selected)}
+        FROM market_data
+        WHERE symbol = %(symbol)s
+        AND timestamp > %(start)s
+    """
+    params = {'symbol': symbol, 'start': start}
+    if end is not None:
+        query += " AND timestamp <= %(end)s"
+        params['end'] = end
+    query += " ORDER BY timestamp DESC"
+    if limit is not None:
+        query += " LIMIT %(limit)s"
+        params['limit'] = limit
+
+    # float32 is plenty for display; hourly volumes can overflow uint32,
+    # so volume stays int64
+    dtypes = {c: 'float32' for c in ('open', 'high', 'low', 'close') if c in selected}
+    return pd.read_sql_query(
+        query,
+        _db().engine,
+        params=params,
+        parse_dates=[c for c in selected if c == 'timestamp'],
+        dtype=dtypes
+    )
+
+
+def get_market_data(
+    symbol: str,
+    force_refresh: bool = False,
+    columns: Optional[list] = None,
+    limit: Optional[int] = 5000,
+    start: str = '2025-01-01',
+    end: Optional[str] = None,
+    lookback_days: Optional[int] = None
+) -> Optional[pd.DataFrame]:
     """Get market data for a symbol, using cached data if available.
-    
+
+    The heavy lifting lives in the cached fetcher, which is shared
+    across sessions — one DataFrame per (symbol, window) serves every
+    user instead of a copy per session_state.
+
     Args:
         symbol: The stock symbol to get data for
         force_refresh: Whether to force a refresh of the data
-        
+        columns: Columns to select (default: OHLCV plus timestamp)
+        limit: Maximum number of rows to fetch, newest first (default
+            5000 — a server-side guardrail against unbounded reads)
+        start: Exclusive lower bound on timestamp (default '2025-01-01')
+        end: Optional inclusive upper bound on timestamp
+        lookback_days: When set, overrides `start` with a cutoff this
+            many days before now
+
     Returns:
         Optional[pd.DataFrame]: The market data or None if not available
     """
-    # Initialize session state for market data if not exists
-    if 'market_data' not in st.session_state:
-        st.session_state.market_data = {}
-    
-    # Check if we need to refresh the data
-    current_time = datetime.now()
-    cache_key = f"{symbol}_data"
-    cache_time_key = f"{symbol}_last_update"
-    
-    should_refresh = (
-        force_refresh or
-        cache_key not in st.session_state.market_data or
-        cache_time_key not in st.session_state.market_data or
-        (current_time - st.session_state.market_data[cache_time_key]) > timedelta(minutes=5)
-    )
-    
-    if should_refresh:
-        try:
-            # Get fresh data from database
-            db = DatabaseManager()
-            with db.get_session() as session:
-                query = text("""
-                    SELECT timestamp, open, high, low, close, volume
-                    FROM market_data
-                    WHERE symbol = :symbol
-                    AND timestamp > '2025-01-01'
-                    ORDER BY timestamp DESC
-                """)
-
-                result = session.execute(query, {'symbol': symbol})
-                data = pd.DataFrame(
-                    result.fetchall(),
-                    columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
-                )
-                
-                if not data.empty:
-                    # Update cache
-                    st.session_state.market_data[cache_key] = data
-                    st.session_state.market_data[cache_time_key] = current_time
-                    return data
-                else:
-                    logger.warning(f"No data available for {symbol}")
-                    return None
-                    
-        except Exception as e:
-            logger.error(f"Error fetching market data for {symbol}: {e}")
+    try:
+        if lookback_days is not None:
+            start = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d %H:%M:%S')
+
+        # Project only the requested columns and cap the row count so
+        # the database does the trimming instead of pandas
+        selected = tuple(columns or ['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+        if force_refresh:
+            _load_market_data.clear()
+
+        data = _load_market_data(symbol, selected, limit, start, end)
+
+        # Shallow copy (cheap under copy-on-write) so the shared cached
+        # frame itself is never touched. Invariant for consumers: frames
+        # carry a DatetimeIndex (the timestamp column is kept for table
+        # display), so render code never has to branch on the index type
+        data = data.copy(deep=False)
+        if 'timestamp' in data.columns:
+            data.index = pd.DatetimeIndex(data['timestamp'])
+
+        if data.empty:
+            logger.warning(f"No data available for {symbol}")
             return None
-    
-    # Return cached data
-    return st.session_state.market_data.get(cache_key)
+
+        # Track refresh times per session for the "Last updated" labels
+        if 'market_data' not in st.session_state:
+            st.session_state.market_data = {}
+        st.session_state.market_data[f"{symbol}_last_update"] = datetime.now()
+        return data
+
+    except Exception as e:
+        logger.error(f"Error fetching market data for {symbol}: {e}")
+        return None
+
+
+@st.cache_resource(ttl=300, show_spinner=False)
+def _load_market_data_bulk(symbols: tuple, lookback_days: int) -> Dict[str, pd.DataFrame]:
+    """Fetch bars for several symbols in one round-trip.
+
+    One ANY(...) query plus a groupby replaces a query per symbol, so a
+    portfolio of N symbols costs one RTT and one parse instead of N.
+    """
+    cutoff = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d %H:%M:%S')
+    query = """
+        SELECT symbol, timestamp, open, high, low, close, volume
+        FROM market_data
+        WHERE symbol = ANY(%(symbols)s)
+        AND timestamp > %(cutoff)s
+        ORDER BY symbol, timestamp DESC
+    """
+    frame = pd.read_sql_query(
+        query,
+        _db().engine,
+        params={'symbols': list(symbols), 'cutoff': cutoff},
+        parse_dates=['timestamp'],
+        dtype={c: 'float32' for c in ('open', 'high', 'low', 'close')}
+    )
+    return {
+        symbol: group.drop(columns='symbol').reset_index(drop=True)
+        for symbol, group in frame.groupby('symbol', sort=False)
+    }
+
+
+def get_market_data_bulk(
+    symbols: list,
+    lookback_days: int = 90,
+    force_refresh: bool = False
+) -> Dict[str, pd.DataFrame]:
+    """Get market data for several symbols from one SQL round-trip.
+
+    Args:
+        symbols: Stock symbols to fetch
+        lookback_days: Days of history to include (default 90)
+        force_refresh: Whether to force a refresh of the data
+
+    Returns:
+        Dict[str, pd.DataFrame]: Frames keyed by symbol, each carrying
+        the usual DatetimeIndex invariant; symbols with no rows are
+        absent
+    """
+    try:
+        if force_refresh:
+            _load_market_data_bulk.clear()
+        frames = _load_market_data_bulk(tuple(symbols), lookback_days)
+
+        out = {}
+        for symbol, frame in frames.items():
+            frame = frame.copy(deep=False)
+            frame.index = pd.DatetimeIndex(frame['timestamp'])
+            out[symbol] = frame
+        return out
+    except Exception as e:
+        logger.error(f"Error bulk-fetching market data for {symbols}: {e}")
+        return {}
 
 
 def get_last_refresh_time(symbol: str) -> Optional[datetime]:
@@ -95,61 +213,96 @@ def clear_market_data_cache(symbol: Optional[str] = None):
     Args:
         symbol: The symbol to clear cache for, or None to clear all
     """
+    # The frames live in the shared st.cache_resource store
+    _load_market_data.clear()
+
     if 'market_data' not in st.session_state:
         return
-        
+
     if symbol:
-        # Clear specific symbol cache
-        cache_key = f"{symbol}_data"
-        cache_time_key = f"{symbol}_last_update"
-        st.session_state.market_data.pop(cache_key, None)
-        st.session_state.market_data.pop(cache_time_key, None)
+        # Clear the symbol's refresh timestamp
+        st.session_state.market_data.pop(f"{symbol}_last_update", None)
     else:
-        # Clear all cache
+        # Clear all refresh timestamps
         st.session_state.market_data = {}
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _latest_two_closes(symbol: str) -> tuple:
+    """Fetch the two newest closes for a symbol.
+
+    The price accessors only ever look at rows 0 and 1, so asking the
+    database for exactly those two rows replaces shipping and
+    materializing the whole history.
+
+    Args:
+        symbol: The stock symbol to fetch closes for
+
+    Returns:
+        tuple: Up to two close prices, newest first (may be empty)
+    """
+    with _db().get_session() as session:
+        query = text("""
+            SELECT close
+            FROM market_data
+            WHERE symbol = :symbol
+            ORDER BY timestamp DESC
+            LIMIT 2
+        """)
+        return tuple(row[0] for row in session.execute(query, {'symbol': symbol}))
+
+
 def get_latest_price(symbol: str) -> Optional[float]:
     """Get the latest price for a symbol using cached data if available.
-    
+
     Args:
         symbol: The stock symbol to get price for
-        
+
     Returns:
         Optional[float]: The latest price or None if not available
     """
-    data = get_market_data(symbol)
-    if data is not None and not data.empty:
-        return data['close'].iloc[0]
-    return None
+    try:
+        closes = _latest_two_closes(symbol)
+    except Exception as e:
+        logger.error(f"Error fetching latest price for {symbol}: {e}")
+        return None
+    return closes[0] if closes else None
 
 
 def get_price_change(symbol: str) -> Optional[float]:
     """Get the 24-hour price change percentage using cached data if available.
-    
+
     Args:
         symbol: The stock symbol to get price change for
-        
+
     Returns:
         Optional[float]: The price change percentage or None if not available
     """
-    data = get_market_data(symbol)
-    if data is not None and len(data) >= 2:
-        return ((data['close'].iloc[0] / data['close'].iloc[1] - 1) * 100)
+    try:
+        closes = _latest_two_closes(symbol)
+    except Exception as e:
+        logger.error(f"Error fetching price change for {symbol}: {e}")
+        return None
+    if len(closes) >= 2:
+        return (closes[0] / closes[1] - 1) * 100
     return None
 
 
+@st.cache_data(ttl=300, show_spinner=False)
 def get_company_info(symbol: str) -> Optional[Dict[str, Any]]:
     """Get company information from the yahoo_company_info table.
-    
+
+    Cached across Streamlit reruns; company info changes rarely, so a
+    5-minute TTL avoids a database hit on every widget tick.
+
     Args:
         symbol: The stock symbol to get company info for
-        
+
     Returns:
         Optional[Dict[str, Any]]: Dictionary containing company info or None if not available
     """
     try:
-        db = DatabaseManager()
+        db = _db()
         with db.get_session() as session:
             query = text("""
                 SELECT "longName", industry, sector, address1, address2, city, state
@@ -1,40 +1,112 @@
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
 import yaml
+try:
+    # libyaml C bindings are ~5x faster than the pure-Python parser
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 from loguru import logger
 from prefect.blocks.system import Secret
 
+_PLACEHOLDER_RE = re.compile(r"\$\{(\w+)\}")
 
+# Placeholder variables the config may reference, mapped to the Prefect
+# Secret block that backs each one
+_SECRET_BLOCKS = {
+    "DB_USER": "db-user",
+    "DB_PASSWORD": "db-password",
+    "ALPACA_API_KEY": "alpaca-api-key",
+    "ALPACA_SECRET_KEY": "alpaca-secret-key",
+}
+
+
+class _SecretLoader(SafeLoader):
+    """SafeLoader that resolves ${VAR} scalars from a secrets map.
+
+    Substituting during the parse touches only the scalar nodes that
+    actually contain a placeholder, instead of a full-text replace per
+    secret before parsing; unknown placeholders are left verbatim.
+    """
+
+    secrets: Dict[str, str] = {}
+
+
+def _secret_constructor(loader, node):
+    value = loader.construct_scalar(node)
+    return _PLACEHOLDER_RE.sub(
+        lambda m: _SecretLoader.secrets.get(m.group(1), m.group(0)), value
+    )
+
+
+_SecretLoader.add_implicit_resolver('!secret', re.compile(r".*\$\{\w+\}.*", re.DOTALL), None)
+_SecretLoader.add_constructor('!secret', _secret_constructor)
+
+
+@lru_cache(maxsize=1)
 def get_config() -> Dict[str, Any]:
-    """Load and parse the configuration file with Prefect secret substitution."""
+    """Load and parse the configuration file with Prefect secret substitution.
+
+    The parsed config is cached for the life of the process — every call
+    after the first is a dict lookup instead of a file read plus four
+    Secret.load round-trips. Use reload_config() after editing the file.
+    """
+    return _load_config_uncached()
+
+
+def reload_config() -> Dict[str, Any]:
+    """Drop the cached configuration and re-read it from disk."""
+    get_config.cache_clear()
+    return get_config()
+
+
+def _load_raw_config(config_path: Path) -> Dict[str, Any]:
+    """Parse config.yaml as-is, without secret substitution.
+
+    Used when rewriting the file so ${VAR} placeholders survive the
+    round trip and no Secret.load calls are made just to merge sections.
+    """
+    with open(config_path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _load_config_uncached() -> Dict[str, Any]:
+    """Read config.yaml and substitute Prefect secrets, uncached."""
     try:
         # Get the project root directory
         project_root = Path(__file__).parent.parent.parent
-        logger.debug(f"Project root: {project_root}")
-        
+        # Lazy debug: the str() formatting only happens if DEBUG is on
+        logger.opt(lazy=True).debug("Project root: {}", lambda: str(project_root))
+
         # Load the config file
         config_path = project_root / "config" / "config.yaml"
-        logger.debug(f"Config path: {config_path}")
-        
+        logger.opt(lazy=True).debug("Config path: {}", lambda: str(config_path))
+
+        # Load secrets from Prefect — but only the ones the file actually
+        # references, so each unused placeholder saves a Secret.load RPC,
+        # and fetch them concurrently so the cold load pays one round-trip
+        # of latency rather than one per secret
         with open(config_path, "r") as f:
-            config_content = f.read()
-        
-        # Load secrets from Prefect
-        secrets = {
-            "DB_USER": Secret.load("db-user").get(),
-            "DB_PASSWORD": Secret.load("db-password").get(),
-            "ALPACA_API_KEY": Secret.load("alpaca-api-key").get(),
-            "ALPACA_SECRET_KEY": Secret.load("alpaca-secret-key").get()
+            raw = f.read()
+        referenced = set(_PLACEHOLDER_RE.findall(raw))
+        to_load = {
+            var: block for var, block in _SECRET_BLOCKS.items()
+            if var in referenced
         }
-        
-        # Replace environment variables with Prefect secrets
-        for var, value in secrets.items():
-            config_content = config_content.replace(f"${{{var}}}", value)
-        
-        # Parse YAML
-        config = yaml.safe_load(config_content)
+        if to_load:
+            with ThreadPoolExecutor(max_workers=len(to_load)) as pool:
+                values = pool.map(lambda block: Secret.load(block).get(), to_load.values())
+            _SecretLoader.secrets = dict(zip(to_load, values))
+        else:
+            _SecretLoader.secrets = {}
+
+        # Parse YAML, substituting placeholders on the scalar nodes
+        config = yaml.load(raw, Loader=_SecretLoader)
         
         # Set REPO_ROOT in config if not already set
         if "REPO_ROOT" not in os.environ:
@@ -68,8 +140,9 @@ def update_config(config: Dict[str, Any]) -> None:
         project_root = Path(__file__).parent.parent.parent
         config_path = project_root / "config" / "config.yaml"
         
-        # Load current config to preserve environment variables
-        current_config = get_config()
+        # Merge into the raw on-disk config: no secret resolution, and
+        # ${VAR} placeholders are preserved in the rewritten file
+        current_config = _load_raw_config(config_path)
         
         # Update only non-sensitive settings
         for section in ["data_collection", "logging", "trading", "data", "ml"]:
@@ -78,8 +151,11 @@ def update_config(config: Dict[str, Any]) -> None:
         
         # Write updated config back to file
         with open(config_path, "w") as f:
-            yaml.safe_dump(current_config, f, default_flow_style=False)
-            
+            yaml.dump(current_config, f, Dumper=SafeDumper, default_flow_style=False)
+
+        # Invalidate the cached config so readers see the new values
+        reload_config()
+
         logger.info("Configuration updated successfully")
         
     except Exception as e:
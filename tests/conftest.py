@@ -1,41 +1,56 @@
 import pytest
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 from unittest.mock import Mock, patch
 
 from src.database.models import Symbol, MarketData
 
+# Frozen fixture timestamp: deterministic across runs, and the
+# session-scoped fixtures never re-read the clock
+_FROZEN_NOW = datetime(2024, 1, 1, 0, 0, 0)
 
-@pytest.fixture
+# Built once at import; the session-scoped fixture hands out the same
+# frame to every test, so nothing pays the construction cost twice
+_BASE_MARKET_DATA = pd.DataFrame({
+    'open': [100.0, 101.0, 102.0, 103.0, 104.0],
+    'high': [101.0, 102.0, 103.0, 104.0, 105.0],
+    'low': [99.0, 100.0, 101.0, 102.0, 103.0],
+    'close': [100.5, 101.5, 102.5, 103.5, 104.5],
+    'volume': [1000, 1100, 1200, 1300, 1400]
+}, index=pd.DatetimeIndex(
+    np.arange('2024-01-01T00', '2024-01-01T05', dtype='datetime64[h]')))
+
+
+@pytest.fixture(scope="session")
 def sample_market_data():
-    """Create sample market data."""
-    dates = pd.date_range(start='2024-01-01', periods=5, freq='H')
-    return pd.DataFrame({
-        'open': [100.0, 101.0, 102.0, 103.0, 104.0],
-        'high': [101.0, 102.0, 103.0, 104.0, 105.0],
-        'low': [99.0, 100.0, 101.0, 102.0, 103.0],
-        'close': [100.5, 101.5, 102.5, 103.5, 104.5],
-        'volume': [1000, 1100, 1200, 1300, 1400]
-    }, index=dates)
+    """Provide the shared sample market data frame (do not mutate)."""
+    return _BASE_MARKET_DATA
 
 
 @pytest.fixture
+def sample_market_data_mutable():
+    """Provide a private copy of the sample frame for tests that mutate."""
+    return _BASE_MARKET_DATA.copy()
+
+
+@pytest.fixture(scope="session")
 def sample_symbol():
     """Create a sample symbol."""
     return Symbol(
         symbol="AAPL",
         name="Apple Inc.",
         is_active=True,
-        start_date=datetime.utcnow()
+        start_date=_FROZEN_NOW
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_market_data_record():
     """Create a sample market data record."""
     return MarketData(
         symbol="AAPL",
-        timestamp=datetime.utcnow(),
+        timestamp=_FROZEN_NOW,
         open=100.0,
         high=101.0,
         low=99.0,
@@ -44,6 +59,20 @@ def sample_market_data_record():
     )
 
 
+@pytest.fixture(scope="session")
+def db_manager():
+    """Share one pooled DatabaseManager across the whole test session.
+
+    The engine already ships pool_pre_ping/pool_recycle, so reusing it
+    means DB-touching tests pay connection setup once instead of per
+    test; the pool is disposed at session end.
+    """
+    from src.database.db_manager import DatabaseManager
+    manager = DatabaseManager()
+    yield manager
+    manager.close()
+
+
 @pytest.fixture
 def mock_db_manager():
     """Create a mock database manager."""
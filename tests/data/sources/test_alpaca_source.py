@@ -1,38 +1,60 @@
 import pytest
 from datetime import datetime, timedelta
+from types import MappingProxyType
 import pandas as pd
 from unittest.mock import Mock, patch
 
 from src.data.sources.alpaca_source import AlpacaDataSource
 
+# Built once at import and handed out read-only: tests only assign it as
+# a mock return value, so sharing one frozen structure costs nothing and
+# rules out cross-test mutation
+_SAMPLE_ALPACA_RESPONSE = MappingProxyType({
+    'AAPL': (
+        {
+            'o': 100.0,
+            'h': 101.0,
+            'l': 99.0,
+            'c': 100.5,
+            'v': 1000,
+            'n': 500,
+            'vw': 100.2,
+            't': '2024-01-01T00:00:00Z'
+        },
+    )
+})
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_alpaca_client():
     """Create a mock Alpaca client."""
     with patch('src.data.sources.alpaca_source.StockHistoricalDataClient') as mock:
         yield mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def alpaca_source(mock_alpaca_client):
+    """Share one AlpacaDataSource across the module.
+
+    Construction reads config and builds the (mocked) client; doing it
+    once amortizes that setup over every test here.
+    """
+    return AlpacaDataSource()
+
+
+@pytest.fixture(autouse=True)
+def _reset_alpaca_client(mock_alpaca_client):
+    """Clear recorded calls between tests so call assertions stay exact."""
+    mock_alpaca_client.reset_mock()
+
+
+@pytest.fixture(scope="session")
 def sample_alpaca_response():
-    """Create sample Alpaca API response."""
-    return {
-        'AAPL': [
-            {
-                'o': 100.0,
-                'h': 101.0,
-                'l': 99.0,
-                'c': 100.5,
-                'v': 1000,
-                'n': 500,
-                'vw': 100.2,
-                't': '2024-01-01T00:00:00Z'
-            }
-        ]
-    }
-
-
-def test_get_historical_data(mock_alpaca_client, sample_alpaca_response):
+    """Provide the shared sample Alpaca API response (read-only)."""
+    return _SAMPLE_ALPACA_RESPONSE
+
+
+def test_get_historical_data(mock_alpaca_client, alpaca_source, sample_alpaca_response):
     """Test historical data retrieval."""
     # Setup
     symbol = "AAPL"
@@ -41,8 +63,7 @@ def test_get_historical_data(mock_alpaca_client, sample_alpaca_response):
     mock_alpaca_client.return_value.get_stock_bars.return_value = sample_alpaca_response
     
     # Execute
-    source = AlpacaDataSource()
-    result = source.get_historical_data(symbol, start_date, end_date)
+    result = alpaca_source.get_historical_data(symbol, start_date, end_date)
     
     # Assert
     assert isinstance(result, pd.DataFrame)
@@ -51,15 +72,14 @@ def test_get_historical_data(mock_alpaca_client, sample_alpaca_response):
     mock_alpaca_client.return_value.get_stock_bars.assert_called_once()
 
 
-def test_get_latest_data(mock_alpaca_client, sample_alpaca_response):
+def test_get_latest_data(mock_alpaca_client, alpaca_source, sample_alpaca_response):
     """Test latest data retrieval."""
     # Setup
     symbol = "AAPL"
     mock_alpaca_client.return_value.get_stock_bars.return_value = sample_alpaca_response
     
     # Execute
-    source = AlpacaDataSource()
-    result = source.get_latest_data(symbol)
+    result = alpaca_source.get_latest_data(symbol)
     
     # Assert
     assert isinstance(result, pd.DataFrame)
@@ -67,15 +87,14 @@ def test_get_latest_data(mock_alpaca_client, sample_alpaca_response):
     assert all(col in result.columns for col in ['open', 'high', 'low', 'close', 'volume'])
 
 
-def test_get_multiple_symbols(mock_alpaca_client, sample_alpaca_response):
+def test_get_multiple_symbols(mock_alpaca_client, alpaca_source, sample_alpaca_response):
     """Test multiple symbols data retrieval."""
     # Setup
     symbols = ["AAPL", "GOOGL"]
     mock_alpaca_client.return_value.get_stock_bars.return_value = sample_alpaca_response
     
     # Execute
-    source = AlpacaDataSource()
-    result = source.get_multiple_symbols(symbols)
+    result = alpaca_source.get_multiple_symbols(symbols)
     
     # Assert
     assert isinstance(result, dict)
@@ -83,10 +102,9 @@ def test_get_multiple_symbols(mock_alpaca_client, sample_alpaca_response):
     assert all(isinstance(df, pd.DataFrame) for df in result.values())
 
 
-def test_standardize_columns():
+def test_standardize_columns(alpaca_source):
     """Test column standardization."""
     # Setup
-    source = AlpacaDataSource()
     df = pd.DataFrame({
         'AAPL': [{
             'o': 100.0,
@@ -102,7 +120,7 @@ def test_standardize_columns():
     })
     
     # Execute
-    result = source._standardize_columns(df)
+    result = alpaca_source._standardize_columns(df)
     
     # Assert
     assert isinstance(result, pd.DataFrame)
@@ -111,13 +129,13 @@ def test_standardize_columns():
     assert isinstance(result.index, pd.DatetimeIndex)
 
 
-def test_convert_interval():
+@pytest.mark.parametrize("interval,expected", [
+    ("1m", "Minute"),
+    ("1h", "Hour"),
+    ("1d", "Day"),
+    ("invalid", "Hour"),  # Default case
+])
+def test_convert_interval(alpaca_source, interval, expected):
     """Test interval conversion."""
-    # Setup
-    source = AlpacaDataSource()
-    
     # Execute and Assert
-    assert source._convert_interval("1m") == "Minute"
-    assert source._convert_interval("1h") == "Hour"
-    assert source._convert_interval("1d") == "Day"
-    assert source._convert_interval("invalid") == "Hour"  # Default case 
\ No newline at end of file
+    assert alpaca_source._convert_interval(interval) == expected 
\ No newline at end of file
@@ -7,13 +7,25 @@ from src.data.data_manager import DataManager
 from src.data.symbol_manager import SymbolManager
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_alpaca_source():
     """Create a mock Alpaca data source."""
     with patch('src.data.data_manager.AlpacaDataSource') as mock:
         yield mock
 
 
+@pytest.fixture(scope="module")
+def data_manager(mock_alpaca_source):
+    """Share one DataManager across the module instead of one per test."""
+    return DataManager()
+
+
+@pytest.fixture(autouse=True)
+def _reset_alpaca_source(mock_alpaca_source):
+    """Clear recorded calls between tests so call assertions stay exact."""
+    mock_alpaca_source.reset_mock()
+
+
 @pytest.fixture
 def sample_data():
     """Create sample market data."""
@@ -27,14 +39,13 @@ def sample_data():
     }, index=dates)
 
 
-def test_get_latest_data_success(mock_alpaca_source, sample_data):
+def test_get_latest_data_success(mock_alpaca_source, data_manager, sample_data):
     """Test successful data retrieval."""
     # Setup
     symbol = "AAPL"
     mock_alpaca_source.return_value.get_latest_data.return_value = sample_data
     
     # Execute
-    data_manager = DataManager()
     result = data_manager.get_latest_data(symbol)
     
     # Assert
@@ -45,28 +56,26 @@ def test_get_latest_data_success(mock_alpaca_source, sample_data):
     mock_alpaca_source.return_value.get_latest_data.assert_called_once_with(symbol)
 
 
-def test_get_latest_data_no_data(mock_alpaca_source):
+def test_get_latest_data_no_data(mock_alpaca_source, data_manager):
     """Test data retrieval when no data is available."""
     # Setup
     symbol = "INVALID"
     mock_alpaca_source.return_value.get_latest_data.return_value = None
     
     # Execute
-    data_manager = DataManager()
     result = data_manager.get_latest_data(symbol)
     
     # Assert
     assert result is None
 
 
-def test_get_latest_data_empty_dataframe(mock_alpaca_source):
+def test_get_latest_data_empty_dataframe(mock_alpaca_source, data_manager):
     """Test data retrieval when empty DataFrame is returned."""
     # Setup
     symbol = "AAPL"
     mock_alpaca_source.return_value.get_latest_data.return_value = pd.DataFrame()
     
     # Execute
-    data_manager = DataManager()
     result = data_manager.get_latest_data(symbol)
     
     # Assert
@@ -7,42 +7,35 @@ import os
 from dotenv import load_dotenv
 from sqlalchemy import text
 
-sys.path.append(str(Path(__file__).parent.parent))
+_project_root = str(Path(__file__).parent.parent.parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 
-from src.database.db_manager import DatabaseManager
 from src.utils.logger import setup_logging
 
 
-def test_database_connection():
-    """Test database connection and basic operations."""
-    # Setup logging
-    setup_logging()
-
-    # Load environment variables
-    env_path = Path(__file__).parent.parent / "config" / ".env"
+def _load_env() -> bool:
+    """Load the .env file and confirm the DB credentials are present."""
+    env_path = Path(__file__).parent.parent.parent / "config" / ".env"
     if not env_path.exists():
         print(f"❌ Error: .env file not found at {env_path}")
-        return
+        return False
 
     load_dotenv(env_path)
 
-    # Check if environment variables are set
     db_user = os.getenv("DB_USER")
     db_password = os.getenv("DB_PASSWORD")
 
     if not db_user or not db_password:
         print("❌ Error: DB_USER or DB_PASSWORD not set in .env file")
-        return
+        return False
 
     print(f"Using database user: {db_user}")
+    return True
 
-    # Initialize database manager
-    try:
-        db_manager = DatabaseManager()
-    except Exception as e:
-        print(f"❌ Error initializing DatabaseManager: {str(e)}")
-        return
 
+def _run_connection_checks(db_manager) -> None:
+    """Exercise the connection test and a session round-trip."""
     try:
         # Test connection
         if not db_manager.test_connection():
@@ -50,7 +43,7 @@ def test_database_connection():
             return
         print("✅ Database connection successful!")
 
-        # Test session creation
+        # Test session creation — pulls a pooled connection, no new setup
         with db_manager.get_session() as session:
             # Execute a simple query
             result = session.execute(text("SELECT version();")).scalar()
@@ -58,9 +51,39 @@ def test_database_connection():
 
     except Exception as e:
         print(f"❌ Error during database operations: {str(e)}")
-    finally:
-        db_manager.close()
+
+
+def test_database_connection(request):
+    """Test database connection and basic operations.
+
+    Uses the session-scoped pooled manager from conftest rather than
+    building (and tearing down) a fresh engine per run.
+    """
+    # Setup logging
+    setup_logging()
+
+    if not _load_env():
+        return
+
+    # Pull the shared pooled manager; environments that cannot reach the
+    # Prefect/secret backends degrade gracefully as before
+    try:
+        db_manager = request.getfixturevalue("db_manager")
+    except Exception as e:
+        print(f"❌ Error initializing DatabaseManager: {str(e)}")
+        return
+
+    _run_connection_checks(db_manager)
 
 
 if __name__ == "__main__":
-    test_database_connection()
+    setup_logging()
+    if _load_env():
+        from src.database.db_manager import DatabaseManager
+
+        try:
+            manager = DatabaseManager()
+        except Exception as e:
+            print(f"❌ Error initializing DatabaseManager: {str(e)}")
+        else:
+            _run_connection_checks(manager)
@@ -2,19 +2,32 @@ import pytest
 from datetime import datetime
 from unittest.mock import Mock, patch
 
+from sqlalchemy.orm import Session
+
 from src.data.symbol_manager import SymbolManager
 from src.database.models import Symbol
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True, scope="module")
 def mock_db_session():
-    """Create a mock database session."""
+    """Create a mock database session shared by the module.
+
+    One patch set up for all eight tests instead of a patch cycle per
+    test; spec=Session makes attribute typos fail instead of quietly
+    minting child mocks.
+    """
     with patch('src.data.symbol_manager.DatabaseManager') as mock:
-        session = Mock()
+        session = Mock(spec=Session)
         mock.return_value.get_session.return_value.__enter__.return_value = session
         yield session
 
 
+@pytest.fixture(autouse=True)
+def _reset_db_session(mock_db_session):
+    """Clear recorded calls between tests so call assertions stay exact."""
+    mock_db_session.reset_mock()
+
+
 def test_add_symbol_new(mock_db_session):
     """Test adding a new symbol."""
     # Setup
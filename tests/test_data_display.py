@@ -4,9 +4,11 @@ from datetime import datetime, timedelta
 import sys
 from pathlib import Path
 
-# Add the project root to Python path
+# Add the project root to Python path (guarded so repeat runs don't
+# grow sys.path; pytest already provides it via pythonpath in pyproject)
 project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from src.data.data_manager import DataManager
 from src.ui.components.data_display import display_market_data
@@ -1,8 +1,10 @@
 from datetime import datetime
 import sys
 from pathlib import Path
+import httpx
 from prefect import flow, get_run_logger
 from prefect.server.schemas.schedules import CronSchedule
+from prefect.task_runners import ConcurrentTaskRunner
 from loguru import logger
 from prefect.client.orchestration import get_client
 from prefect.settings import PREFECT_API_URL
@@ -10,41 +12,64 @@ from prefect.settings import PREFECT_API_URL
 # Add project root to Python path
 sys.path.append(str(Path(__file__).parent))
 
+try:
+    # libuv-backed event loop: a drop-in policy swap that cuts asyncio
+    # overhead for the server health check and Prefect client calls.
+    # Optional — not available on Windows, so missing is fine.
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Configure logging
 logger.remove()  # Remove default handler
 logger.add(
     sys.stdout,  # Use stdout instead of stderr
     format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
     level="DEBUG",  # Set to DEBUG level
-    colorize=True,
-    backtrace=True,
-    diagnose=True
+    # diagnose walks frame locals on every exception record and backtrace
+    # expands the full stack — too costly (and too chatty) for a deployed
+    # process; colorize is left to loguru's tty auto-detection
+    enqueue=True,
+    backtrace=False,
+    diagnose=False
 )
 
-# Import after path setup
-from src.data.data_manager import collect_market_data, store_market_data
-from src.data.yahoo_finance_loader import YahooFinanceDataLoader
 
 
 def generate_flow_run_name(flow_prefix: str) -> str:
-    return f"{flow_prefix}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    # Direct integer formatting skips strftime's locale-aware C path
+    n = datetime.now()
+    return (f"{flow_prefix}-{n.year:04d}{n.month:02d}{n.day:02d}"
+            f"-{n.hour:02d}{n.minute:02d}{n.second:02d}")
 
 
-@flow(flow_run_name=lambda: generate_flow_run_name("data-ingestion"))
+@flow(flow_run_name=lambda: generate_flow_run_name("data-ingestion"),
+      task_runner=ConcurrentTaskRunner())
 def data_ingestion_subflow():
     """Main flow for data ingestion."""
+    # Imported lazily: pulls in pandas, SQLAlchemy and the Alpaca client,
+    # which would otherwise slow every cold start of this script
+    from src.data.data_manager import fetch_symbol_data, store_symbol_data
+    from src.data.symbol_manager import SymbolManager
+
     logger = get_run_logger()
     logger.info("Starting data ingestion flow...")
 
     try:
-        # Collect market data
-        logger.debug("Starting market data collection...")
-        data = collect_market_data()
-        logger.debug(f"Collected data for symbols: {list(data.keys())}")
-
-        # Store market data
-        logger.debug("Starting market data storage...")
-        store_market_data(data)
+        symbols = SymbolManager.get_active_symbols()
+        if not symbols:
+            logger.warning("No active symbols to ingest")
+            return
+
+        # One fetch task per symbol fans the network calls out across the
+        # runner's threads; each store runs as soon as its fetch resolves,
+        # so collection and storage overlap and one bad symbol retries
+        # alone instead of re-running the whole batch
+        fetch_futures = fetch_symbol_data.map(symbols)
+        store_futures = store_symbol_data.map(symbols, fetch_futures)
+        for future in store_futures:
+            future.result()
 
         logger.info("Data ingestion flow completed successfully")
     except Exception as e:
@@ -55,6 +80,8 @@ def data_ingestion_subflow():
 @flow(flow_run_name=lambda: generate_flow_run_name("data-ingestion-yahoo-company"))
 def data_ingestion_yahoo_company_subflow():
     """Main flow for data ingestion."""
+    from src.data.yahoo_finance_loader import YahooFinanceDataLoader
+
     logger = get_run_logger()
     logger.info("Starting yahoo company data ingestion flow...")
 
@@ -69,15 +96,55 @@ def data_ingestion_yahoo_company_subflow():
         raise
 
 
+# Lazily opened shared client: get_client() builds a fresh
+# httpx.AsyncClient (TLS context, connection pool) per context manager,
+# so one instance is reused for every call made on the same event loop
+_client_cm = None
+_client = None
+
+
+async def get_shared_client():
+    """Return the process-wide Prefect client, opening it on first use."""
+    global _client_cm, _client
+    if _client is None:
+        _client_cm = get_client()
+        _client = await _client_cm.__aenter__()
+    return _client
+
+
+async def close_shared_client():
+    """Tear down the shared client if it was opened."""
+    global _client_cm, _client
+    if _client_cm is not None:
+        await _client_cm.__aexit__(None, None, None)
+        _client_cm = _client = None
+
+
 async def check_prefect_server():
     """Check if Prefect server is accessible."""
+    # One GET against /health answers liveness in a single round trip
+    # instead of making the server run a flow-table query
+    api_url = PREFECT_API_URL.value()
+    if api_url:
+        try:
+            async with httpx.AsyncClient(timeout=2.0) as client:
+                response = await client.get(f"{api_url.rstrip('/')}/health")
+            return response.status_code == 200
+        except Exception as e:
+            logger.debug(f"Health endpoint probe failed, falling back: {str(e)}")
+
+    # Fallback: let the orchestration client resolve the API location
     try:
-        async with get_client() as client:
-            await client.read_flows()
+        client = await get_shared_client()
+        await client.read_flows()
         return True
     except Exception as e:
         logger.error(f"Failed to connect to Prefect server: {str(e)}")
         return False
+    finally:
+        # asyncio.run tears the loop down after this probe, so the
+        # client must not outlive it; long-lived loops can keep it open
+        await close_shared_client()
 
 
 if __name__ == "__main__":
@@ -92,12 +159,19 @@ if __name__ == "__main__":
         sys.exit(1)
 
     try:
-        data_ingestion_subflow.serve(
+        # One-shot registration against a work pool instead of .serve():
+        # no always-on process polling the API per deployment — a single
+        # shared worker ("prefect worker start --pool default-pool")
+        # dispatches runs for every registered flow
+        deployment_id = data_ingestion_subflow.to_deployment(
             name="trading-data-ingestion",
             cron="0 * * * *",
             tags=["trading", "data-ingestion", "hourly"],
-            description="Hourly data ingestion flow for trading system"
-        )
+            description="Hourly data ingestion flow for trading system",
+            work_pool_name="default-pool"
+        ).apply()
+        logger.info(f"Registered deployment {deployment_id}")
+        logger.info("Ensure a worker is running: prefect worker start --pool default-pool")
     except Exception as e:
         logger.error(f"Failed to deploy flow: {str(e)}")
         sys.exit(1)